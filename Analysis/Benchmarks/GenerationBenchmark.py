@@ -0,0 +1,210 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  GenerationBenchmark
+
+This script measures every generator class and the to_dataframe persistence steps at several scales, writes the results as JSON,
+and flags any phase that has become slower than a saved baseline. Run it from the Analysis directory:
+
+    python -m Benchmarks.GenerationBenchmark --scales 10000 100000 1000000
+    python -m Benchmarks.GenerationBenchmark --save-baseline
+
+Phases:
+    generate:  The generator's own engine, e.g. SchoolAttendance.generate_data or OrderHistory.generate_columns
+    dataframe: pd.DataFrame construction and the class's dtype plan
+    sort:      The sort (and id column) that to_dataframe applies
+    csv:       save_dataframe to a CSV file
+    sqlite:    SQLiteLoader.load with the class's declared schema and indexes
+
+Considerations:
+    Each case runs in a freshly spawned process, so peak RSS (the process high-water mark after each phase) isn't inflated by earlier cases.
+    Output files go to a temporary directory, so benchmarking never overwrites `Data/`.
+    A phase is flagged as a regression when it is more than tolerance slower than the baseline and at least min_seconds slower,
+    which keeps millisecond-scale noise on small runs from being reported.
+'''
+
+from concurrent.futures                 import ProcessPoolExecutor
+from datetime                           import date, datetime
+from multiprocessing                    import get_context
+from Classes.CustomerInfo               import CustomerInfo
+from Classes.OrderHistory               import OrderHistory
+from Classes.SchoolAttendance           import SchoolAttendance
+from Classes.SQLiteLoader               import SQLiteLoader
+from Classes.Students                   import Students
+from Classes.Utilities                  import *
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+
+class GenerationBenchmark:
+    def __init__(self,
+                 scales      = (10000, 100000, 1000000),
+                 cases       = ('school_attendance', 'students', 'order_history', 'customer_info'),
+                 tolerance   = 0.25,
+                 min_seconds = 0.05):
+        self.scales      = scales
+        self.cases       = cases
+        self.tolerance   = tolerance
+        self.min_seconds = min_seconds
+        self.results     = None
+
+    # Accessors
+    def get_case(self, case, scale):
+        '''
+        Build the generator for a case at roughly `scale` output rows, and return its generate callable with its to_dataframe arguments.
+
+        Considerations:
+            Setup that isn't part of the measured path, such as the orders CustomerInfo reads its spend weights from, is done here.
+        '''
+        if case == 'school_attendance':
+            generator = SchoolAttendance(date(2023, 1, 1), date(2023, 1, 31), max(1, scale // 31), seed = 0)
+            return generator.generate_data, generator, ['student_id', 'date'], True
+
+        if case == 'students':
+            generator = Students(SchoolAttendance(date(2023, 1, 1), date(2023, 1, 31), scale, seed = 0), seed = 0)
+            return generator.generate_columns, generator, ['student_id'], False
+
+        if case == 'order_history':
+            generator = OrderHistory(scale * 75, 75, date(2022, 1, 1), date(2022, 12, 31), seed = 0)
+            return generator.generate_columns, generator, ['order_id'], False
+
+        if case == 'customer_info':
+            generator = CustomerInfo(OrderHistory(scale * 3 * 75, 75, date(2022, 1, 1), date(2022, 12, 31), seed = 0), seed = 0)
+            return generator.generate_columns, generator, ['customer_id'], False
+
+        raise ValueError(f'Unknown benchmark case: {case}')
+
+    def get_peak_rss(self):
+        '''
+        Return this process's peak resident set size in MB. ru_maxrss is in KB on Linux and in bytes on macOS.
+        '''
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 ** 2 if sys.platform == 'darwin' else 1024), 1)
+
+    # Prescriptive Methods
+    def run_case(self, case, scale, directory):
+        '''
+        Run every phase of one case at one scale and return its rows and per-phase wall time, rows/sec, and peak RSS.
+        '''
+        generate, generator, by, add_id = self.get_case(case, scale)
+        phases                          = {}
+        state                           = {}
+
+        def measure(phase, step):
+            start         = time.perf_counter()
+            state['data'] = step(state.get('data'))
+            seconds       = time.perf_counter() - start
+            phases[phase] = {'seconds'     : round(seconds, 4),
+                             'peak_rss_mb' : self.get_peak_rss()}
+
+        def sort(df):
+            df = df.sort_values(by)
+            if add_id:
+                df.insert(0, 'id', range(1, len(df) + 1))
+            return df
+
+        def load(df):
+            loader = SQLiteLoader(os.path.join(directory, f'{case}.db'))
+            loader.load(case, df, generator.sql_schema, generator.sql_indexes)
+            loader.close()
+            return df
+
+        measure('generate',  lambda _:  generate())
+        measure('dataframe', lambda data: optimize_dtypes(pd.DataFrame(data), generator.dtypes))
+        measure('sort',      sort)
+        measure('csv',       lambda df: save_dataframe(df, os.path.join(directory, f'{case}.csv')) or df)
+        measure('sqlite',    load)
+
+        rows = len(state['data'])
+        for phase in phases.values():
+            phase['rows_per_second'] = round(rows / phase['seconds']) if phase['seconds'] else None
+
+        return {'case'   : case,
+                'scale'  : scale,
+                'rows'   : rows,
+                'phases' : phases}
+
+    def run(self):
+        '''
+        Run every case at every scale, each in its own spawned process, and keep the results on the benchmark.
+        '''
+        results = []
+        with tempfile.TemporaryDirectory() as directory:
+            for scale in self.scales:
+
+                for case in self.cases:
+
+                    with ProcessPoolExecutor(1, mp_context = get_context('spawn')) as executor:
+                        result = executor.submit(self.run_case, case, scale, directory).result()
+
+                    results.append(result)
+                    print(f"{case:>18} {scale:>9,} rows: " +
+                          '  '.join(f"{phase} {values['seconds']:.3f}s" for phase, values in result['phases'].items()), flush = True)
+
+        self.results = {'created'  : datetime.now().isoformat(timespec = 'seconds'),
+                        'python'   : platform.python_version(),
+                        'platform' : platform.platform(),
+                        'results'  : results}
+        return self.results
+
+    def compare(self, baseline):
+        '''
+        Return a description of every (case, scale, phase) that is slower than the same entry in baseline beyond the tolerance.
+        '''
+        previous    = {(result['case'], result['scale']): result['phases'] for result in baseline['results']}
+        regressions = []
+        for result in self.results['results']:
+
+            for phase, values in result['phases'].items():
+
+                before = previous.get((result['case'], result['scale']), {}).get(phase)
+                if before is None:
+                    continue
+
+                slower = values['seconds'] - before['seconds']
+                if slower > self.min_seconds and values['seconds'] > before['seconds'] * (1 + self.tolerance):
+                    regressions.append(f"{result['case']} {result['scale']:,} {phase}: "
+                                       f"{before['seconds']:.3f}s → {values['seconds']:.3f}s (+{slower / before['seconds']:.0%})")
+
+        return regressions
+
+    def save(self, filename):
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok = True)
+        with open(filename, 'w') as file:
+            json.dump(self.results, file, indent = 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Benchmark data generation and persistence at several scales.')
+    parser.add_argument('--scales',        type = int,   nargs = '+', default = [10000, 100000, 1000000])
+    parser.add_argument('--cases',         nargs = '+',  default = ['school_attendance', 'students', 'order_history', 'customer_info'])
+    parser.add_argument('--output',        default = save_path(False, 'Benchmarks', 'results', 'generation.json'))
+    parser.add_argument('--baseline',      default = save_path(False, 'Benchmarks', 'baseline.json'))
+    parser.add_argument('--save-baseline', action = 'store_true')
+    parser.add_argument('--tolerance',     type = float, default = 0.25)
+    parser.add_argument('--min-seconds',   type = float, default = 0.05)
+    args = parser.parse_args()
+
+    benchmark = GenerationBenchmark(args.scales, args.cases, args.tolerance, args.min_seconds)
+    benchmark.run()
+    benchmark.save(args.output)
+    print(f'Results written to {args.output}')
+
+    if args.save_baseline:
+        benchmark.save(args.baseline)
+        print(f'Baseline written to {args.baseline}')
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            regressions = benchmark.compare(json.load(file))
+
+        print('\n'.join(['Regressions:'] + regressions) if regressions else 'No regressions against the baseline.')
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
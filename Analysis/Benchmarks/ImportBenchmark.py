@@ -0,0 +1,174 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  ImportBenchmark
+
+This script measures the cold-start import time of each generator module and checks that none of them loads a plotting or
+notebook dependency. Run it from the Analysis directory:
+
+    python -m Benchmarks.ImportBenchmark
+    python -m Benchmarks.ImportBenchmark --save-baseline
+
+Checks:
+    budget:   The fastest import of a module must finish within max_seconds
+    headless: Importing a module must not load any of the forbidden packages (matplotlib, seaborn, IPython, sklearn)
+    baseline: The fastest import must not be more than tolerance slower (and at least min_seconds slower) than a saved baseline
+
+Considerations:
+    Each import runs in a fresh interpreter, so nothing is already cached in sys.modules, and the fastest of several repeats is kept
+    to reduce noise from the disk cache and other processes.
+    The slowest dependencies come from python -X importtime, so a regression can be traced to the package that caused it.
+'''
+
+from datetime import datetime
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+# Runs in the child interpreter: time the import, then report it with the forbidden packages that ended up loaded
+CHILD = '''
+import json, sys, time
+start   = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': sorted(set(name.split('.')[0] for name in sys.modules) & set({forbidden}))}}))
+'''
+
+class ImportBenchmark:
+    def __init__(self,
+                 modules     = ('Classes.Utilities', 'Classes.SchoolAttendance', 'Classes.Students', 'Classes.OrderHistory',
+                                'Classes.CustomerInfo', 'Classes.DatasetCache', 'Classes.__main__'),
+                 forbidden   = ('matplotlib', 'seaborn', 'IPython', 'sklearn'),
+                 repeats     = 5,
+                 max_seconds = 1.5,
+                 tolerance   = 0.25,
+                 min_seconds = 0.05):
+        self.modules     = modules
+        self.forbidden   = forbidden
+        self.repeats     = repeats
+        self.max_seconds = max_seconds
+        self.tolerance   = tolerance
+        self.min_seconds = min_seconds
+        self.results     = None
+
+    # Accessors
+    def get_slowest_imports(self, importtime, count = 5):
+        '''
+        Return the count top-level packages with the largest cumulative import time, in seconds, from python -X importtime output.
+        A package's time is its largest cumulative entry, which is the import of its top-level module. Classes itself is left out.
+        '''
+        packages = {}
+        for line in importtime.splitlines():
+
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+
+            _, cumulative, name = line.split('|')
+            package             = name.strip().split('.')[0]
+            if package != 'Classes':
+                packages[package] = max(packages.get(package, 0), int(cumulative) / 1e6)
+
+        return sorted(packages.items(), key = lambda item: item[1], reverse = True)[:count]
+
+    # Prescriptive Methods
+    def run_module(self, module):
+        '''
+        Import module in repeats fresh interpreters, and return its fastest import time, forbidden packages, and slowest dependencies.
+        '''
+        script = CHILD.format(module = module, forbidden = list(self.forbidden))
+        runs   = []
+        for _ in range(self.repeats):
+
+            child = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output = True, text = True, check = True)
+            runs.append((json.loads(child.stdout.splitlines()[-1]), child.stderr))
+
+        fastest, importtime = min(runs, key = lambda run: run[0]['seconds'])
+        return {'module'  : module,
+                'seconds' : round(fastest['seconds'], 4),
+                'loaded'  : fastest['loaded'],
+                'slowest' : [[package, round(seconds, 4)] for package, seconds in self.get_slowest_imports(importtime)]}
+
+    def run(self):
+        results = []
+        for module in self.modules:
+
+            result = self.run_module(module)
+            results.append(result)
+            print(f"{module:>26}: {result['seconds']:.3f}s  " +
+                  '  '.join(f'{package} {seconds:.3f}s' for package, seconds in result['slowest']), flush = True)
+
+        self.results = {'created'  : datetime.now().isoformat(timespec = 'seconds'),
+                        'python'   : platform.python_version(),
+                        'platform' : platform.platform(),
+                        'results'  : results}
+        return self.results
+
+    def check(self, baseline = None):
+        '''
+        Return a description of every module that is over budget, loads a forbidden package, or is slower than in baseline.
+        '''
+        previous = {result['module']: result['seconds'] for result in baseline['results']} if baseline else {}
+        failures = []
+        for result in self.results['results']:
+
+            module, seconds = result['module'], result['seconds']
+            if seconds > self.max_seconds:
+                failures.append(f'{module}: {seconds:.3f}s is over the {self.max_seconds:.3f}s budget')
+
+            if result['loaded']:
+                failures.append(f"{module}: loads {', '.join(result['loaded'])}")
+
+            before = previous.get(module)
+            if before is not None and seconds - before > self.min_seconds and seconds > before * (1 + self.tolerance):
+                failures.append(f'{module}: {before:.3f}s → {seconds:.3f}s (+{(seconds - before) / before:.0%})')
+
+        return failures
+
+    def save(self, filename):
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok = True)
+        with open(filename, 'w') as file:
+            json.dump(self.results, file, indent = 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Benchmark the cold-start import time of the generator modules.')
+    parser.add_argument('--modules',       nargs = '+')
+    parser.add_argument('--repeats',       type = int,   default = 5)
+    parser.add_argument('--max-seconds',   type = float, default = 1.5)
+    parser.add_argument('--output',        default = os.path.join('Benchmarks', 'results', 'imports.json'))
+    parser.add_argument('--baseline',      default = os.path.join('Benchmarks', 'imports_baseline.json'))
+    parser.add_argument('--save-baseline', action = 'store_true')
+    parser.add_argument('--tolerance',     type = float, default = 0.25)
+    parser.add_argument('--min-seconds',   type = float, default = 0.05)
+    args = parser.parse_args()
+
+    benchmark = ImportBenchmark(repeats     = args.repeats,
+                                max_seconds = args.max_seconds,
+                                tolerance   = args.tolerance,
+                                min_seconds = args.min_seconds)
+    if args.modules:
+        benchmark.modules = args.modules
+
+    benchmark.run()
+    benchmark.save(args.output)
+    print(f'Results written to {args.output}')
+
+    if args.save_baseline:
+        benchmark.save(args.baseline)
+        print(f'Baseline written to {args.baseline}')
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    failures = benchmark.check(baseline)
+    print('\n'.join(['Failures:'] + failures) if failures else 'Every import is within budget and headless.')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  AttendanceMatrix
+
+This script stores attendance as a student × day bit matrix instead of one record per (date, student). Each student is one row
+of bits packed 8 days to a byte with np.packbits, next to the date and student_id vectors that label the rows and columns.
+
+Layout:
+    bits (uint8):           A student_ids × ceil(dates / 8) matrix, where bit d of a row is 1 if the student attended on dates[d]
+    dates (datetime64[D]):  The column labels, in order
+    student_ids (int):      The row labels, in order
+
+Considerations:
+    100K students × 180 days fits in 2.3 MB, compared with 18M rows of date, student_id, and attendance in the long format.
+    Rates are computed by counting set bits with a 256-entry popcount table, so no query unpacks the whole matrix.
+    Padding bits at the end of each row are always 0, so they never add to a count.
+    The long DataFrame format is only produced on demand, one block of students at a time, by generate_chunks and to_frame.
+'''
+
+from .Utilities import *
+import numpy    as np
+import pandas   as pd
+
+# The number of set bits in every possible byte
+POPCOUNT = np.unpackbits(np.arange(256, dtype = 'uint8')[:, None], axis = 1).sum(axis = 1)
+
+class AttendanceMatrix:
+    def __init__(self, bits, dates, student_ids):
+        self.bits        = np.asarray(bits, dtype = 'uint8')
+        self.dates       = np.asarray(dates, dtype = 'datetime64[D]')
+        self.student_ids = np.asarray(student_ids)
+
+    # Accessors
+    def get_rows(self, student_ids = None):
+        '''
+        Return the row positions for the given student_ids, or every row by default. Raises KeyError for ids not in the matrix.
+        '''
+        if student_ids is None:
+            return slice(None)
+
+        student_ids = np.atleast_1d(student_ids)
+        rows        = np.searchsorted(self.student_ids, student_ids)
+        found       = rows < len(self.student_ids)
+        found[found] &= self.student_ids[rows[found]] == student_ids[found]
+        if not found.all():
+            raise KeyError(f'Unknown student_ids: {student_ids[~found][:10].tolist()}')
+
+        return rows
+
+    def get_day_counts(self, rows = slice(None)):
+        '''
+        Return the number of students in rows that attended on each date, counting one bit position across every byte column at a time.
+        '''
+        bits   = self.bits[rows]
+        counts = np.stack([((bits >> (7 - position)) & 1).sum(axis = 0, dtype = 'int64') for position in range(8)], axis = 1)
+
+        return counts.ravel()[:len(self.dates)]
+
+    def get_student_rates(self):
+        '''
+        Return each student's attendance rate across every date as a Series indexed by student_id.
+        '''
+        counts = POPCOUNT[self.bits].sum(axis = 1, dtype = 'int64')
+        return pd.Series(counts / len(self.dates), index = pd.Index(self.student_ids, name = 'student_id'), name = 'attendance')
+
+    def get_daily_rates(self, student_ids = None):
+        '''
+        Return the attendance rate on each date as a Series indexed by date, across every student or only the given student_ids.
+        '''
+        rows  = self.get_rows(student_ids)
+        total = len(self.student_ids) if student_ids is None else len(rows)
+
+        return pd.Series(self.get_day_counts(rows) / total, index = pd.Index(self.dates, name = 'date'), name = 'attendance')
+
+    def get_group_rates(self, groups, daily = False):
+        '''
+        Return attendance rates for each group of students, e.g. each school_district.
+
+        Args:
+            groups (pd.Series): The group label for each student, indexed by student_id.
+            daily (bool): If True, return one rate per group and date instead of one rate per group.
+
+        Returns:
+            pd.DataFrame: The group, optionally the date, and the attendance rate, one row per group (and date).
+        '''
+        groups = groups.reindex(self.student_ids)
+        frames = []
+        for group, members in groups.groupby(groups, observed = True):
+
+            rows = self.get_rows(members.index.to_numpy())
+            if daily:
+                frames.append(pd.DataFrame({groups.name   : group,
+                                            'date'        : self.dates,
+                                            'attendance'  : self.get_day_counts(rows) / len(rows)}))
+            else:
+                frames.append(pd.DataFrame({groups.name   : [group],
+                                            'attendance'  : [POPCOUNT[self.bits[rows]].sum(dtype = 'int64') / (len(rows) * len(self.dates))]}))
+
+        return pd.concat(frames, ignore_index = True)
+
+    # Prescriptive Methods
+    def generate_chunks(self, chunk_size = 1000000):
+        '''
+        Expand the matrix into the long SchoolAttendance format, yielding DataFrames of roughly chunk_size rows in (student_id, date) order.
+        '''
+        per_chunk  = max(1, chunk_size // len(self.dates))
+        month_days = get_month_day(self.dates)
+
+        for start in range(0, len(self.student_ids), per_chunk):
+
+            student_ids = self.student_ids[start:start + per_chunk]
+            attendance  = np.unpackbits(self.bits[start:start + per_chunk], axis = 1, count = len(self.dates))
+            yield pd.DataFrame({'date'       : np.tile(self.dates, len(student_ids)),
+                                'student_id' : np.repeat(student_ids, len(self.dates)),
+                                'attendance' : attendance.ravel().astype(bool),
+                                'month_day'  : np.tile(month_days, len(student_ids))})
+
+    def to_frame(self):
+        return pd.concat(self.generate_chunks(), ignore_index = True)
+
+    def save(self, filename):
+        np.savez_compressed(filename, bits = self.bits, dates = self.dates, student_ids = self.student_ids)
+
+    @staticmethod
+    def load(filename):
+        matrix = np.load(filename)
+        return AttendanceMatrix(matrix['bits'], matrix['dates'], matrix['student_ids'])
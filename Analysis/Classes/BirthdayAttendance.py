@@ -0,0 +1,66 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  BirthdayAttendance
+
+This script answers the birthday questions about the `students` and `school_attendance` datasets in pandas, without comparing
+formatted date strings. Both datasets carry an integer month_day key, so a birthday is any attendance record whose
+(student_id, month_day) matches the student's own.
+
+Output:
+    get_absent_on_birthday:     Every student profile with an absence_date for each birthday they did not attend
+    get_birthday_rate_by_grade: total_bdays, bday_attendees, and attendance_rate (%) for each grade_level
+
+Considerations:
+    The birthday records are found once, when the object is created. Each student's month_day is placed in an array indexed by
+    student_id, so matching every attendance record is a single gather and comparison rather than a join over the full table.
+    Only about 1 in 365 attendance records survive that mask, so merging them with the student profiles is small, and both
+    questions are then answered from the cached birthday records.
+'''
+
+import numpy as np
+
+class BirthdayAttendance:
+    def __init__(self, students, attendance):
+        self.students   = students
+        self.attendance = attendance
+        self.birthdays  = self.set_birthdays()
+
+    # Mutators
+    def set_birthdays(self):
+        '''
+        Return the student profiles merged with their attendance records on every date that matches their month_day.
+        '''
+        student_ids    = self.students['student_id'].to_numpy()
+        attendance_ids = self.attendance['student_id'].to_numpy()
+
+        month_days              = np.full(max(student_ids.max(), attendance_ids.max()) + 1, -1, dtype = 'int16')
+        month_days[student_ids] = self.students['month_day'].to_numpy()
+
+        matches = self.attendance.loc[month_days[attendance_ids] == self.attendance['month_day'].to_numpy(),
+                                      ['student_id', 'date', 'attendance']]
+
+        return self.students.merge(matches, on = 'student_id')
+
+    # Accessors
+    def get_absent_on_birthday(self):
+        '''
+        Return every student that did not attend school on their birthday, with the date of each absence.
+        '''
+        absences = self.birthdays.loc[~self.birthdays['attendance'].astype(bool)]
+
+        return absences.drop(columns = 'attendance') \
+                       .rename(columns = {'date': 'absence_date'}) \
+                       .reset_index(drop = True)
+
+    def get_birthday_rate_by_grade(self):
+        '''
+        Return the attendance rate for each grade level on days that were a student's birthday.
+        '''
+        rates = self.birthdays.groupby('grade_level')['attendance'] \
+                              .agg(total_bdays = 'count', bday_attendees = 'sum') \
+                              .reset_index()
+
+        rates['attendance_rate'] = (rates['bday_attendees'] / rates['total_bdays'] * 100).round(2)
+
+        return rates
@@ -0,0 +1,162 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  ChunkPipeline
+
+This script runs a chunk producer and several sinks (e.g. the CSV writer and the SQLite loader) at the same time, so generating the
+next chunk overlaps with encoding and writing the previous ones. write_chunks uses it when called with pipelined = True.
+
+Usage:
+    pipeline = ChunkPipeline({'csv': write_csv, 'sqlite': load_sqlite}, queue_size = 2)
+    rows     = pipeline(generate_chunks())
+
+    Each sink is a function that takes an iterator of chunks and consumes it to the end, e.g. writing a header before the first
+    chunk and building indexes after the last. Each one runs in its own thread, reading from its own queue.
+
+Considerations:
+    Every queue holds at most queue_size chunks, so a producer that outpaces the slowest sink blocks instead of buffering the
+    whole dataset (backpressure). Peak memory is about (queue_size + 2) chunks per sink.
+    If a sink raises, the producer stops, the other sinks are told to abort, and the sink's exception is re-raised by __call__.
+    If the producer raises, every sink is told to abort and the producer's exception is re-raised once they have stopped.
+    A sink that returns before reading its last chunk is treated as failed, since nothing would drain its queue again.
+    Aborted sinks see a ChunkPipeline.Aborted exception from their iterator, so `with` blocks and `finally` clauses still run.
+    SQLite releases the GIL while it executes each insert, and so do file writes, so the stages overlap when more than one core is
+    available. On a single core the threads only interleave, and the wall time stays close to the sum of the stages.
+    The busy time of each stage is kept in self.stats next to the total wall time, so the two can be compared.
+'''
+
+import queue
+import threading
+import time
+
+class ChunkPipeline:
+    class Aborted(Exception):
+        pass
+
+    # Sentinels sent through the queues after the last chunk, or instead of the next chunk when the pipeline fails
+    DONE  = object()
+    ABORT = object()
+
+    def __init__(self, sinks, queue_size = 2, poll_seconds = 0.1):
+        self.sinks        = sinks
+        self.queue_size   = queue_size
+        self.poll_seconds = poll_seconds
+        self.queues       = {name: queue.Queue(queue_size) for name in sinks}
+        self.errors       = {}
+        self.stats        = {}
+        self.failed       = threading.Event()
+        self.stopped      = {name: threading.Event() for name in sinks}
+
+    # Mutators
+    def set_sink_thread(self, name):
+        '''
+        Return a started thread that runs the named sink over the chunks arriving on its queue, recording its busy time and any error.
+        '''
+        drained = threading.Event()
+
+        def chunks():
+            while True:
+
+                chunk = self.queues[name].get()
+                if chunk is self.DONE:
+                    drained.set()
+                    return
+                if chunk is self.ABORT:
+                    raise ChunkPipeline.Aborted(f'{name} was aborted')
+
+                start = time.perf_counter()
+                yield chunk
+                self.stats[name] = self.stats.get(name, 0.0) + time.perf_counter() - start
+
+        def run():
+            try:
+                self.sinks[name](chunks())
+                if not drained.is_set():
+                    raise RuntimeError(f'{name} returned before reading its last chunk')
+            except ChunkPipeline.Aborted:
+                pass
+            except BaseException as error:
+                self.errors[name] = error
+                self.failed.set()
+            finally:
+                self.stopped[name].set()
+
+        thread = threading.Thread(target = run, name = f'ChunkPipeline-{name}', daemon = True)
+        thread.start()
+        return thread
+
+    # Accessors
+    def get_error(self):
+        return next(iter(self.errors.values()), None)
+
+    # Prescriptive Methods
+    def put(self, name, item):
+        '''
+        Put item on a sink's queue, blocking while it is full. Gives up (returning False) once any sink has failed or this
+        sink's thread has stopped for any reason, since nothing will drain its queue again.
+        '''
+        while True:
+            try:
+                self.queues[name].put(item, timeout = self.poll_seconds)
+                return True
+            except queue.Full:
+                if self.failed.is_set() or self.stopped[name].is_set():
+                    return False
+
+    def put_final(self, name, item, thread):
+        '''
+        Deliver the final sentinel to a running sink. The sink keeps draining its queue until it sees it, unless it fails meanwhile.
+        '''
+        while thread.is_alive():
+            try:
+                self.queues[name].put(item, timeout = self.poll_seconds)
+                return
+            except queue.Full:
+                continue
+
+    def __call__(self, chunks):
+        '''
+        Send every chunk to every sink and wait for them to finish.
+
+        Args:
+            chunks (iterable of pd.DataFrame): The chunks to persist. Sinks must treat them as read-only, since they share them.
+
+        Returns:
+            int: The number of rows produced.
+        '''
+        threads  = {name: self.set_sink_thread(name) for name in self.sinks}
+        rows     = 0
+        produced = None
+        wall     = time.perf_counter()
+        try:
+            chunks = iter(chunks)
+            while not self.failed.is_set():
+
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                self.stats['produce'] = self.stats.get('produce', 0.0) + time.perf_counter() - start
+                if chunk is None:
+                    break
+
+                rows += len(chunk)
+                for name in self.sinks:
+                    self.put(name, chunk)
+
+        except BaseException as error:
+            produced = error
+            self.failed.set()
+
+        # Every sink that is still running is told to finish, or to abort if anything failed
+        for name, thread in threads.items():
+            if name not in self.errors:
+                self.put_final(name, self.ABORT if self.failed.is_set() else self.DONE, thread)
+            thread.join()
+
+        self.stats['wall'] = time.perf_counter() - wall
+
+        if produced is not None:
+            raise produced
+        if self.errors:
+            raise self.get_error()
+
+        return rows
@@ -22,21 +22,54 @@ Data Constraints:
     The values for `customer_name`, `phone`, and `address` are random and fake.
     There are 10 sales representatives with IDs from 1 to 10.
     The `credit_limit` should allow customers to buy between 1 and 30 orders per month. It's also influenced by their purchase history.
+    Purchase history is read from the orders cached by OrderHistory, so the weights match the persisted `order_history` table.
+    The columnar engine assembles `customer_name`, `phone`, and `address` from an IdentityPool instead of calling Faker per customer.
+    For very large customer pools, stream() writes the customers in customer_id chunks, so memory stays bounded by the chunk size.
+    Passing workers to __call__ splits the customers into seeded shards, producing the same records for any number of processes.
 '''
 
-from faker      import Faker
-from uszipcode  import SearchEngine
-from .Utilities import *
-import random   as rn
-import numpy    as np
+from copy          import copy
+from faker         import Faker
+from .IdentityPool import IdentityPool
+from .ZipIndex     import ZipIndex
+from .Utilities    import *
+import random      as rn
+import numpy       as np
 
 class CustomerInfo:
-    def __init__(self, order_history):
+    def __init__(self, order_history, seed = None, workers = None):
         self.order_history = order_history
+        self.seed          = seed
+        self.workers       = workers
         self.fake          = Faker()
-        self.search        = SearchEngine()
+        self.zip_index     = ZipIndex()
         self.spend_weights = self.order_history.get_spend_weights()
 
+        # Declared SQLite table, schema, and the indexes built after each load
+        self.sql_table   = 'customer_info'
+        self.sql_schema  = {'customer_id'           : 'INTEGER PRIMARY KEY',
+                            'customer_name'         : 'TEXT',
+                            'phone'                 : 'TEXT',
+                            'address'               : 'TEXT',
+                            'city'                  : 'TEXT',
+                            'state'                 : 'TEXT',
+                            'postal_code'           : 'TEXT',
+                            'sales_rep_employee_id' : 'TEXT',
+                            'credit_limit'          : 'REAL'}
+        self.sql_indexes = ['state']
+
+        # Compact in-memory dtypes applied by to_dataframe
+        self.dtypes = {'customer_id'           : self.order_history.dtypes['customer_id'],
+                       'city'                  : 'category',
+                       'state'                 : 'category',
+                       'postal_code'           : 'category',
+                       'sales_rep_employee_id' : 'category'}
+
+        # Separate child seeds keep the identity pool's stream independent from the other columns
+        rng_seed, identity_seed = np.random.SeedSequence(seed).spawn(2)
+        self.rng                = np.random.default_rng(rng_seed)
+        self.identities         = IdentityPool(identity_seed)
+
     # Mutators
     def set_customer_id(self):
         return self.order_history.get_customer_ids()
@@ -50,27 +83,14 @@ class CustomerInfo:
     def set_address(self):
         return self.fake.street_address()
 
-    def set_city_state_zip(self):
-        '''
-        Generate city, state, and postal_code that are geographically consistent. Sometimes the Faker() will supply an invalid state, so the loop
-        will fall back on defaults in the event a new state can't be found after a few tries.
+    def set_city_state_zip(self, n):
         '''
-        excluded_states = ['AK', 'HI', 'DC', 'PR']
-        for i in range(5):
+        Generate n cities, states, and postal_codes that are geographically consistent.
 
-            try:
-                state = self.fake.state_abbr()
-                if state not in excluded_states:
-
-                    choice = rn.choice(self.search.by_state(state))
-                    if choice:
-                        return choice.major_city, state, choice.zipcode
-                    
-            except IndexError:
-                pass
-            
-        # If no valid city, state, and zipcode can be generated after 5 tries, return defaults
-        return 'Los Angeles', 'CA', '90210'
+        Considerations:
+            All n locations are drawn at once from the bundled ZipIndex, so no database queries are made while generating customers.
+        '''
+        return self.zip_index.set_city_state_zip(n, self.rng)
 
     def set_sales_rep_employee_id(self):
         return f'SRE{rn.randint(1, 10)}'
@@ -78,22 +98,32 @@ class CustomerInfo:
     def set_credit_limit(self, customer_id):
         return round(np.random.uniform(1000, 5000) * self.spend_weights.get(customer_id, 1), -2)
 
+    # Columnar Mutators
+    def set_sales_rep_employee_ids(self, n):
+        return np.char.add('SRE', self.rng.integers(1, 11, n).astype(str))
+
+    def set_credit_limits(self, customer_ids):
+        weights = pd.Series(customer_ids).map(self.spend_weights).fillna(1).to_numpy()
+        return np.round(self.rng.uniform(1000, 5000, len(customer_ids)) * weights, -2)
+
     # Prescriptive Methods
     def generate_data(self):
         '''
         Generate a list of dictionaries with randomized customer information to be output as either a CSV file or a pandas DataFrame for immediate use.
         '''
-        data = []
-        for customer_id in self.set_customer_id():
+        data         = []
+        customer_ids = self.set_customer_id()
+        locations    = zip(*self.set_city_state_zip(len(customer_ids)))
+
+        for customer_id, (city, state, postal_code) in zip(customer_ids, locations):
 
-            city, state, postal_code = self.set_city_state_zip()
             customer_info = {'customer_id'          : customer_id,
                              'customer_name'        : self.set_customer_name(),
                              'phone'                : self.set_phone(),
                              'address'              : self.set_address(),
-                             'city'                 : city,
-                             'state'                : state,
-                             'postal_code'          : postal_code,
+                             'city'                 : str(city),
+                             'state'                : str(state),
+                             'postal_code'          : str(postal_code),
                              'sales_rep_employee_id': self.set_sales_rep_employee_id(),
                              'credit_limit'         : self.set_credit_limit(customer_id)}
             
@@ -101,14 +131,105 @@ class CustomerInfo:
 
         return data
 
-    def __call__(self):
+    def generate_columns(self, customer_ids = None):
         '''
-        Generate a pandas DataFrame of randomized customer information.
+        Generate a dictionary of NumPy arrays with randomized customer information, using the same schema as generate_data.
+
+        Considerations:
+            Names, phones, and addresses come from the IdentityPool, which can spread very large runs across self.workers processes.
+            Passing customer_ids limits the records to that subset, which is how generate_chunks splits the work.
+        '''
+        if customer_ids is None:
+            customer_ids = np.fromiter(self.set_customer_id(), dtype = np.int64)
+
+        n                        = len(customer_ids)
+        identities               = self.identities.get_identities(n, self.workers)
+        city, state, postal_code = self.set_city_state_zip(n)
+
+        return {'customer_id'           : customer_ids,
+                'customer_name'         : identities['customer_name'],
+                'phone'                 : identities['phone'],
+                'address'               : identities['address'],
+                'city'                  : city,
+                'state'                 : state,
+                'postal_code'           : postal_code,
+                'sales_rep_employee_id' : self.set_sales_rep_employee_ids(n),
+                'credit_limit'          : self.set_credit_limits(customer_ids)}
+
+    def generate_chunks(self, chunk_size = 1000000):
         '''
-        df = to_dataframe(data      = self.generate_data(),
-                          by        = ['customer_id'],
-                          add_id    = False,
-                          filename  = save_path(True, 'Data', 'customer_info.csv'),
-                          sql_table = 'customer_info')
+        Yield DataFrames of randomized customer information for consecutive ranges of chunk_size sorted customer_ids, so the chunks arrive in key order.
+        '''
+        customer_ids = np.sort(np.fromiter(self.set_customer_id(), dtype = np.int64))
+        for start in range(0, len(customer_ids), chunk_size):
+            yield pd.DataFrame(self.generate_columns(customer_ids[start:start + chunk_size]))
 
-        return df
\ No newline at end of file
+    def generate_shard(self, customer_ids, seed):
+        '''
+        Generate a DataFrame of customer information for the given customer_ids, using a copy of this object whose generators
+        (including the IdentityPool's) are seeded for this shard.
+        '''
+        rng_seed, identity_seed          = seed.spawn(2)
+        worker                           = copy(self)
+        worker.rng                       = np.random.default_rng(rng_seed)
+        worker.workers                   = None
+        worker.identities                = copy(self.identities)
+        worker.identities.seed_sequence  = identity_seed
+
+        return pd.DataFrame(worker.generate_columns(customer_ids))
+
+    def generate_parallel(self, workers = None, shard_size = 1000000):
+        '''
+        Generate every customer in sorted customer_id ranges of shard_size, each with a seed spawned from self.seed.
+        '''
+        customer_ids = np.sort(np.fromiter(self.set_customer_id(), dtype = np.int64))
+        shards       = [customer_ids[start:start + shard_size] for start in range(0, len(customer_ids), shard_size)]
+
+        # Draw the identity pools once here, so every shard's copy shares them instead of drawing its own
+        self.identities.get_pools()
+
+        return generate_shards(self.generate_shard, shards, self.seed, workers)
+
+    def __call__(self, columnar = True, workers = None, fmt = 'csv'):
+        '''
+        Generate a pandas DataFrame of randomized customer information.
+
+        Considerations:
+            The columnar engine is used by default. Passing columnar = False falls back to the original row-by-row generate_data.
+            Passing workers uses the sharded, seeded engine. workers = 1 runs the same shards in this process with identical output.
+            A seed also selects the sharded engine for the columnar default, running its shards in this process, so the same seed
+            gives the same customers for any number of workers.
+            fmt can be 'csv', 'parquet', or 'feather', and the file can be reloaded with load_dataframe.
+            When the shared profiler is enabled, a summary of mutator and persistence costs is printed at the end.
+        '''
+        with profiler.step(f'{type(self).__name__}.generate'):
+            if workers or (columnar and self.seed is not None):
+                data = self.generate_parallel(workers)
+            else:
+                data = self.generate_columns() if columnar else self.generate_data()
+
+        df = to_dataframe(data        = data,
+                          by          = ['customer_id'],
+                          add_id      = False,
+                          filename    = save_path(True, 'Data', f'{self.sql_table}.{fmt}'),
+                          sql_table   = self.sql_table,
+                          sql_schema  = self.sql_schema,
+                          sql_indexes = self.sql_indexes,
+                          dtypes      = self.dtypes)
+
+        profiler.report('CustomerInfo')
+        return df
+
+    def stream(self, chunk_size = 1000000, pipelined = False):
+        '''
+        Write customer information to CSV and SQLite one chunk at a time instead of building a single DataFrame.
+        Passing pipelined = True writes the CSV and SQLite table in their own threads while the next chunks are generated.
+        Returns the number of rows written.
+        '''
+        return write_chunks(chunks      = self.generate_chunks(chunk_size),
+                            add_id      = False,
+                            filename    = save_path(True, 'Data', f'{self.sql_table}.csv'),
+                            sql_table   = self.sql_table,
+                            sql_schema  = self.sql_schema,
+                            sql_indexes = self.sql_indexes,
+                            pipelined   = pipelined)
\ No newline at end of file
@@ -0,0 +1,191 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  CustomerMetrics
+
+This script computes every per-customer and per-cohort aggregate the order analyses use in a single sort-and-reduce pass over the
+orders cached by OrderHistory, and persists them as the `customer_metrics`, `customer_months`, and `cohort_ltv` tables. The charts
+and questions then read these tables instead of regrouping every order.
+
+Schema (customer_metrics):
+    customer_id (varchar):         The customer, one row each
+    order_count (integer):         The number of orders the customer placed
+    total_amount (currency):       The total order amount across those orders
+    aov (currency):                The customer's average order value, total_amount / order_count
+    first_order_date (timestamp):  The date of the customer's first order
+    last_order_date (timestamp):   The date of the customer's last order
+    days_between (integer):        The number of days between the first and last order
+    first_order_amount (currency): The order amount of the customer's first order
+    cohort (timestamp):            The first day of the month of the customer's first order
+
+Schema (customer_months):
+    customer_id (varchar):         The customer
+    month (timestamp):             The first day of a month the customer ordered in, one row per customer and month
+
+Schema (cohort_ltv):
+    cohort (timestamp):            The cohort month
+    tenure (integer):              The number of months since the cohort month
+    order_amount (currency):       The total order amount of the cohort's customers in that month of tenure
+    customers (integer):           The number of customers in the cohort
+    mean_amount (currency):        order_amount / customers
+    ltv (currency):                The cumulative mean_amount through that month of tenure
+
+Considerations:
+    The orders are sorted once by (customer_id, order_date), so every customer's orders are contiguous and in date order. Each
+    per-customer column is then one np.add.reduceat over those runs, or a lookup at the start or end of each run.
+    The same order puts each customer's months in order, so customer_months keeps every order whose month differs from the one before.
+    Ties between orders on a customer's first date are broken by their position in the orders, which ROW_NUMBER() leaves unspecified.
+'''
+
+from .Utilities import *
+import numpy    as np
+import pandas   as pd
+
+class CustomerMetrics:
+    def __init__(self, order_history):
+        self.order_history = order_history
+        self.origin        = None
+        self.months        = None
+        self.cohorts       = None
+
+        # Declared SQLite table, schema, and the indexes built after each load
+        self.sql_table   = 'customer_metrics'
+        self.sql_schema  = {'customer_id'        : 'INTEGER PRIMARY KEY',
+                            'order_count'        : 'INTEGER',
+                            'total_amount'       : 'REAL',
+                            'aov'                : 'REAL',
+                            'first_order_date'   : 'DATE',
+                            'last_order_date'    : 'DATE',
+                            'days_between'       : 'INTEGER',
+                            'first_order_amount' : 'REAL',
+                            'cohort'             : 'DATE'}
+        self.sql_indexes = ['cohort', 'first_order_amount']
+
+        # Compact in-memory dtypes applied by to_dataframe
+        self.dtypes = {'customer_id'      : order_history.dtypes['customer_id'],
+                       'order_count'      : 'int32',
+                       'first_order_date' : 'datetime64[s]',
+                       'last_order_date'  : 'datetime64[s]',
+                       'days_between'     : 'int32',
+                       'cohort'           : 'datetime64[s]'}
+
+        # The per-customer months, keyed for lookups of one customer and month, persisted next to customer_metrics
+        self.months_table  = 'customer_months'
+        self.months_schema = {'customer_id' : 'INTEGER',
+                              'month'       : 'DATE'}
+
+        # The per-cohort table, persisted next to customer_metrics
+        self.cohort_table  = 'cohort_ltv'
+        self.cohort_schema = {'cohort'       : 'DATE',
+                              'tenure'       : 'INTEGER',
+                              'order_amount' : 'REAL',
+                              'customers'    : 'INTEGER',
+                              'mean_amount'  : 'REAL',
+                              'ltv'          : 'REAL'}
+
+    # Mutators
+    def set_cohorts(self, cohorts, tenures, amounts, customers):
+        '''
+        Sum order amounts by (cohort, tenure) with one bincount, and keep the LTV curve of every cohort as self.cohorts.
+
+        Args:
+            cohorts (np.ndarray): Each order's cohort, as a month index since self.origin.
+            tenures (np.ndarray): Each order's months since its cohort month.
+            amounts (np.ndarray): Each order's amount.
+            customers (np.ndarray): The number of customers in each cohort, indexed by cohort month.
+        '''
+        width  = int(tenures.max()) + 1
+        keys   = cohorts * width + tenures
+        orders = np.bincount(keys, minlength = len(customers) * width)
+        totals = np.bincount(keys, weights = amounts, minlength = len(customers) * width)
+
+        cohort, tenure = np.divmod(np.flatnonzero(orders), width)
+        cohorts        = pd.DataFrame({'cohort'       : (self.origin + cohort).astype('datetime64[D]'),
+                                       'tenure'       : tenure,
+                                       'order_amount' : totals[orders > 0],
+                                       'customers'    : customers[cohort]})
+
+        cohorts['mean_amount'] = cohorts['order_amount'] / cohorts['customers']
+        cohorts['ltv']         = cohorts.groupby('cohort')['mean_amount'].cumsum()
+        self.cohorts           = optimize_dtypes(cohorts, {'cohort': 'datetime64[s]'})
+
+    # Accessors
+    def get_cohort_ltv(self):
+        return self.cohorts
+
+    # Prescriptive Methods
+    def generate_data(self):
+        '''
+        Reduce the cached orders to one row of metrics per customer, and the per-cohort LTV curves, in a single pass.
+
+        Returns:
+            dict: NumPy arrays for each customer_metrics column, one entry per customer in ascending customer_id order.
+        '''
+        orders      = self.order_history.get_orders()
+        customer_id = orders['customer_id'].to_numpy()
+        order_dates = orders['order_date'].to_numpy().astype('datetime64[D]')
+        amounts     = orders['order_amount'].to_numpy(dtype = float)
+
+        # One stable sort makes every customer's orders a contiguous run in date order
+        order       = np.lexsort((order_dates, customer_id))
+        customer_id = customer_id[order]
+        order_dates = order_dates[order]
+        amounts     = amounts[order]
+        starts      = np.flatnonzero(np.r_[True, customer_id[1:] != customer_id[:-1]])
+        ends        = np.r_[starts[1:], len(order)] - 1
+        counts      = ends - starts + 1
+
+        # Month indexes since January of the first order year, for customer_months and the cohorts
+        self.origin = order_dates.min().astype('datetime64[Y]').astype('datetime64[M]')
+        months      = (order_dates.astype('datetime64[M]') - self.origin).astype('int64')
+        new_months  = np.r_[True, (customer_id[1:] != customer_id[:-1]) | (months[1:] != months[:-1])]
+        self.months = optimize_dtypes(pd.DataFrame({'customer_id' : customer_id[new_months],
+                                                    'month'       : (self.origin + months[new_months]).astype('datetime64[D]')}),
+                                      {'customer_id' : self.dtypes['customer_id'], 'month' : 'datetime64[s]'})
+
+        totals        = np.add.reduceat(amounts, starts)
+        first_dates   = order_dates[starts]
+        last_dates    = order_dates[ends]
+        cohort_months = months[starts]
+
+        self.set_cohorts(np.repeat(cohort_months, counts), months - np.repeat(cohort_months, counts), amounts,
+                         np.bincount(cohort_months, minlength = months.max() + 1))
+
+        return {'customer_id'        : customer_id[starts],
+                'order_count'        : counts,
+                'total_amount'       : np.round(totals, 2),
+                'aov'                : np.round(totals / counts, 2),
+                'first_order_date'   : first_dates,
+                'last_order_date'    : last_dates,
+                'days_between'       : (last_dates - first_dates).astype('int64'),
+                'first_order_amount' : amounts[starts],
+                'cohort'             : (self.origin + cohort_months).astype('datetime64[D]')}
+
+    def __call__(self, fmt = 'csv'):
+        '''
+        Generate a pandas DataFrame of per-customer metrics, and persist it, the per-customer months, and the per-cohort LTV curves.
+
+        Considerations:
+            The id field isn't required, since the table's cardinality is already fully determined by customer_id.
+            fmt can be 'csv', 'parquet', or 'feather', and the file can be reloaded with load_dataframe.
+            When the shared profiler is enabled, a summary of the reduction and persistence costs is printed at the end.
+        '''
+        with profiler.step('CustomerMetrics.generate'):
+            data = self.generate_data()
+
+        df = to_dataframe(data        = data,
+                          add_id      = False,
+                          filename    = save_path(True, 'Data', f'{self.sql_table}.{fmt}'),
+                          sql_table   = self.sql_table,
+                          sql_schema  = self.sql_schema,
+                          sql_indexes = self.sql_indexes,
+                          dtypes      = self.dtypes)
+
+        with profiler.step('CustomerMetrics.months'):
+            get_loader().load(self.months_table, self.months, self.months_schema, [('customer_id', 'month')])
+
+        with profiler.step('CustomerMetrics.cohorts'):
+            get_loader().load(self.cohort_table, self.cohorts, self.cohort_schema, [('cohort', 'tenure')])
+
+        profiler.report('CustomerMetrics')
+        return df
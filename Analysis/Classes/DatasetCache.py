@@ -0,0 +1,197 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  DatasetCache
+
+This script caches generated datasets on disk, addressed by a hash of everything that determines their contents, so unchanged
+notebook runs load the previous result instead of regenerating and rewriting it.
+
+Usage:
+    cache      = DatasetCache()
+    attendance = cache(SchoolAttendance(date(2023, 1, 1), date(2023, 1, 31), 1000))
+    orders     = cache(OrderHistory(7000000, 75, date(2022, 1, 1), date(2022, 12, 31)), fmt = 'parquet')
+
+Key:
+    The generator's class, its constructor parameters (read back from the attributes of the same name, recursively for generators
+    such as the SchoolAttendance inside Students), the __call__ arguments that change the data, and a code version hashed from every
+    module in Classes. Editing any generator or utility invalidates every entry.
+    Execution-only parameters (fmt, workers, chunk_size, shard_size) are left out, since the data is identical for any value of them.
+
+Considerations:
+    Entries are uncompressed Arrow IPC files, memory-mapped on load with their pandas dtypes (categoricals, datetime64[s], int32) intact.
+    On a hit, `Data/<table>.<fmt>` and the SQLite table are only rewritten if the last dataset persisted there was a different one,
+    or rows have been appended to the table since (e.g. by OrderHistory.append), so the table always matches the returned DataFrame.
+    Appended rows aren't part of an entry, so they're dropped on the next hit, and append() continues from the cached dataset.
+    Unseeded generators are cached too, so a notebook keeps showing the same draw until its parameters change or refresh = True is passed.
+    A generator that depends on another (CustomerInfo on OrderHistory, Students on SchoolAttendance) is keyed on the entry that
+    generator was served from, so it's never paired with a different draw. An unseeded one that never went through the cache gets a
+    fresh key, so its dependents are regenerated.
+    A hit on OrderHistory restores its customer pool from the cached orders, so CustomerInfo and append() use the same customers,
+    and its id allocator keys and pool seed from the entry's metadata, so append() can't reissue a cached order_id. When the table
+    is reloaded, that state is saved to `order_history_state` too, so append() in a later session restores it from the table.
+    pyarrow is only imported when an entry is read or written.
+    Least recently used entries are evicted once the cache holds more than max_bytes or max_entries.
+'''
+
+from .Utilities import *
+import glob
+import hashlib
+import inspect
+import json
+import uuid
+
+class DatasetCache:
+    def __init__(self,
+                 directory   = save_path(True, 'Data', 'cache'),
+                 max_bytes   = 2 * 1024 ** 3,
+                 max_entries = 32):
+        self.directory   = directory
+        self.max_bytes   = max_bytes
+        self.max_entries = max_entries
+        self.manifest    = os.path.join(directory, 'persisted.json')
+        self.version     = self.get_code_version()
+
+        # Parameters and __call__ arguments that change how a dataset is produced or saved, but never its contents
+        self.execution_parameters = ('fmt', 'workers', 'chunk_size', 'shard_size')
+
+        os.makedirs(directory, exist_ok = True)
+
+    # Accessors
+    def get_code_version(self):
+        '''
+        Hash the source of every module in Classes, so a change to any generator or utility produces new keys.
+        '''
+        digest = hashlib.sha256()
+        for filename in sorted(glob.glob(os.path.join(os.path.dirname(__file__), '*.py'))):
+            with open(filename, 'rb') as file:
+                digest.update(file.read())
+
+        return digest.hexdigest()[:16]
+
+    def get_fingerprint(self, value, nested = False):
+        '''
+        Describe value with JSON-serializable types. Generator objects are described by their class and constructor parameters.
+        A generator nested in another is also described by the cache entry it came from, or by a fresh id if it's unseeded and
+        didn't come from the cache, since its parameters don't determine its draw.
+        '''
+        if type(value).__module__.startswith(__package__):
+            parameters  = [name for name in list(inspect.signature(type(value).__init__).parameters)[1:] if name not in self.execution_parameters]
+            fingerprint = {'class'      : type(value).__name__,
+                           'parameters' : {name: self.get_fingerprint(getattr(value, name, None), True) for name in parameters}}
+
+            if nested and (getattr(value, 'cache_key', None) or getattr(value, 'seed', None) is None):
+                fingerprint['entry'] = getattr(value, 'cache_key', None) or uuid.uuid4().hex
+
+            return fingerprint
+
+        return repr(value)
+
+    def get_key(self, generator, arguments):
+        fingerprint = {'generator' : self.get_fingerprint(generator),
+                       'arguments' : {name: repr(value) for name, value in sorted(arguments.items()) if name not in self.execution_parameters},
+                       'version'   : self.version}
+
+        return hashlib.sha256(json.dumps(fingerprint, sort_keys = True).encode()).hexdigest()[:32]
+
+    def get_persisted(self):
+        if not os.path.exists(self.manifest):
+            return {}
+        with open(self.manifest) as file:
+            return json.load(file)
+
+    def get_entry(self, generator, df):
+        '''
+        Convert df to an Arrow table, storing the generator's get_cache_state() (e.g. OrderHistory's id allocator keys) in its metadata.
+        '''
+        import pyarrow as pa
+
+        data = pa.Table.from_pandas(df)
+        if hasattr(generator, 'get_cache_state'):
+            state = json.dumps(generator.get_cache_state()).encode()
+            data  = data.replace_schema_metadata({**(data.schema.metadata or {}), b'generator_state': state})
+
+        return data
+
+    def get_row_count(self, table):
+        return get_loader().connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+    def is_persisted(self, persisted, key, filename, table, rows):
+        '''
+        Check whether the dataset for key is the one currently in filename and in the SQLite table, and nothing has been appended to it since.
+        '''
+        return (persisted.get(filename) == key and persisted.get(table) == key and os.path.exists(filename)
+                and get_loader().has_table(table) and self.get_row_count(table) == rows)
+
+    # Prescriptive Methods
+    def __call__(self, generator, refresh = False, **arguments):
+        '''
+        Return the generator's DataFrame from the cache, or generate it with generator(**arguments) and cache it.
+
+        Args:
+            generator: A SchoolAttendance, Students, OrderHistory, or CustomerInfo object.
+            refresh (bool, optional): Regenerate and replace the cached entry even if one exists. Defaults to False.
+            arguments: Passed through to generator.__call__, e.g. fmt = 'parquet' or workers = 4.
+
+        Returns:
+            pd.DataFrame: The same DataFrame generator(**arguments) would return.
+        '''
+        import pyarrow.feather as feather
+
+        key      = self.get_key(generator, arguments)
+        entry    = os.path.join(self.directory, f'{key}.feather')
+        table    = generator.sql_table
+        filename = save_path(True, 'Data', f"{table}.{arguments.get('fmt', 'csv')}")
+
+        if os.path.exists(entry) and not refresh:
+            data  = feather.read_table(entry, memory_map = True)
+            df    = data.to_pandas()
+            state = json.loads((data.schema.metadata or {}).get(b'generator_state', b'null'))
+            os.utime(entry)
+
+            reload = not self.is_persisted(self.get_persisted(), key, filename, table, len(df))
+            if reload:
+                save_dataframe(df, filename)
+                get_loader().load(table, df, generator.sql_schema, generator.sql_indexes)
+
+            # OrderHistory's accessors and customer pool come from the cached orders, so they describe the same dataset
+            if hasattr(generator, 'set_orders'):
+                generator.set_orders(df, state)
+
+            # The restored state is saved next to the reloaded table (e.g. `order_history_state`), and reports built from the
+            # table (e.g. OrderHistory's store_daily_sales) are rebuilt from the reloaded rows
+            if reload and hasattr(generator, 'save_state'):
+                generator.save_state()
+            if reload and hasattr(generator, 'refresh_reports'):
+                generator.refresh_reports()
+        else:
+            df = generator(**arguments)
+            feather.write_feather(self.get_entry(generator, df), entry, compression = 'uncompressed')
+            self.evict()
+
+        generator.cache_key = key
+        self.set_persisted(key, filename, table)
+        return df
+
+    def set_persisted(self, key, filename, table):
+        persisted = self.get_persisted()
+        persisted.update({filename: key, table: key})
+
+        with open(self.manifest, 'w') as file:
+            json.dump(persisted, file, indent = 2)
+
+    def evict(self):
+        '''
+        Delete the least recently used entries until the cache is within max_bytes and max_entries.
+        '''
+        entries = sorted(glob.glob(os.path.join(self.directory, '*.feather')), key = os.path.getmtime, reverse = True)
+        total   = 0
+        for i, entry in enumerate(entries):
+
+            total += os.path.getsize(entry)
+            if i >= self.max_entries or (total > self.max_bytes and i > 0):
+                os.remove(entry)
+
+    def clear(self):
+        for entry in glob.glob(os.path.join(self.directory, '*.feather')) + [self.manifest]:
+            if os.path.exists(entry):
+                os.remove(entry)
@@ -0,0 +1,69 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  IdAllocator
+
+This script allocates unique, random-looking integer ids from a fixed range, e.g. the 7-digit (or wider) order and customer ids. The k-th id is
+a keyed pseudorandom permutation of k, so N ids are produced in one vectorized step and can never collide.
+
+Method:
+    A 4-round Feistel network shuffles the bits of k over the smallest even-bit domain that covers the range. Values that land
+    outside the range are passed through the network again (cycle walking) until they land inside it. The round keys are drawn
+    from the seed, so the same seed always produces the same sequence of ids.
+
+Considerations:
+    Any slice of positions can be allocated independently, so parallel shards can draw their own ids from disjoint position ranges.
+    The allocator keeps a running position for sequential callers, and raises once every id in the range has been used.
+    The range covers at most 4 times as many values as it needs, so each id takes fewer than 2 passes through the network on average.
+'''
+
+import numpy as np
+
+class IdAllocator:
+    def __init__(self, low, high, seed = None, rounds = 4):
+        self.low      = low
+        self.high     = high
+        self.size     = high - low
+        self.half     = max(1, (int(self.size - 1).bit_length() + 1) // 2)
+        self.mask     = np.uint64((1 << self.half) - 1)
+        self.keys     = np.random.default_rng(seed).integers(0, 2 ** 32, rounds, dtype = np.uint64)
+        self.position = 0
+
+    # Mutators
+    def set_permutation(self, values):
+        '''
+        Apply the Feistel network to an array of uint64 values within the 2 ** (2 * half) domain.
+        '''
+        left  = values >> np.uint64(self.half)
+        right = values & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (((right ^ key) * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(32) & self.mask)
+
+        return (left << np.uint64(self.half)) | right
+
+    # Accessors
+    def get_ids(self, n, position = None):
+        '''
+        Return the n ids at the given position in the sequence, or at the running position (which then advances by n).
+
+        Args:
+            n (int): The number of ids to allocate.
+            position (int, optional): The index of the first id. Shards pass their own offset here.
+
+        Returns:
+            np.ndarray: n unique int64 ids between low (inclusive) and high (exclusive).
+        '''
+        start = self.position if position is None else position
+        if start + n > self.size:
+            raise ValueError(f'Only {self.size - start:,} unused ids remain between {self.low:,} and {self.high:,}, but {n:,} were requested')
+
+        values  = self.set_permutation(np.arange(start, start + n, dtype = np.uint64))
+        outside = values >= self.size
+        while outside.any():
+            values[outside] = self.set_permutation(values[outside])
+            outside         = values >= self.size
+
+        if position is None:
+            self.position += n
+
+        return values.astype(np.int64) + self.low
@@ -0,0 +1,129 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  IdentityPool
+
+This script generates fake customer identities in bulk. Faker is only used up front to draw pools of names and street
+components, and N records are then assembled from those pools with NumPy indexing.
+
+Output:
+    customer_name (string): A first and last name, occasionally with a prefix or suffix
+    phone (varchar):        A phone number in one of Faker's en_US formats
+    address (string):       A building number and street name, with a secondary address half of the time
+
+Considerations:
+    The pools are drawn with Faker's own weighted providers, so common names show up about as often as they do with Faker().name().
+    The pools are only drawn the first time identities are requested, so creating a pool whose output is never needed is cheap.
+    Records are assembled in fixed-size shards, each with its own seed spawned from the pool's SeedSequence. The output is the same
+    whether the shards run in this process or across a ProcessPoolExecutor.
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+from functools          import reduce
+from itertools          import repeat
+from faker              import Faker
+from faker.providers.phone_number.en_US import Provider as PhoneProvider
+from faker.providers.address.en_US      import Provider as AddressProvider
+import numpy as np
+
+class IdentityPool:
+    def __init__(self, seed = None, pool_size = 5000, shard_size = 1000000):
+        self.seed_sequence = np.random.SeedSequence(seed) if not isinstance(seed, np.random.SeedSequence) else seed
+        self.pool_size     = pool_size
+        self.shard_size    = shard_size
+        self.fake          = Faker('en_US')
+        self.fake.seed_instance(int(self.seed_sequence.generate_state(1)[0]))
+
+        self.pools = None
+
+    # Mutators
+    def set_pools(self):
+        '''
+        Draw every component pool once. Faker's weighted providers are sampled pool_size times so their frequencies carry over.
+        '''
+        draw = lambda provider: np.array([provider() for _ in range(self.pool_size)])
+
+        return {'first_names'       : draw(self.fake.first_name),
+                'last_names'        : draw(self.fake.last_name),
+                'prefixes'          : draw(self.fake.prefix),
+                'suffixes'          : draw(self.fake.suffix),
+                'street_suffixes'   : np.array(AddressProvider.street_suffixes),
+                'building_formats'  : AddressProvider.building_number_formats,
+                'secondary_formats' : AddressProvider.secondary_address_formats,
+                'phone_formats'     : PhoneProvider.formats}
+
+    # Accessors
+    def get_pools(self):
+        if self.pools is None:
+            self.pools = self.set_pools()
+
+        return self.pools
+
+    def get_identities(self, n, workers = None):
+        '''
+        Return a dictionary of n customer_name, phone, and address values.
+
+        Args:
+            n (int):                 The number of identities to assemble.
+            workers (int, optional): Assemble shards across this many processes. Defaults to assembling them in this process.
+
+        Considerations:
+            Each call spawns fresh shard seeds, so consecutive calls produce different identities while remaining reproducible.
+        '''
+        sizes = [min(self.shard_size, n - start) for start in range(0, n, self.shard_size)]
+        seeds = self.seed_sequence.spawn(len(sizes))
+
+        if workers:
+            with ProcessPoolExecutor(workers) as executor:
+                shards = list(executor.map(assemble_identities, repeat(self.get_pools()), sizes, seeds))
+        else:
+            shards = list(map(assemble_identities, repeat(self.get_pools()), sizes, seeds))
+
+        return {column: np.concatenate([shard[column] for shard in shards]) for column in ['customer_name', 'phone', 'address']}
+
+
+def numerify(template, n, rng):
+    '''
+    Vectorized equivalent of Faker's numerify. '#' becomes 0-9, '%' becomes 1-9, '$' becomes 2-9, and every other character is kept.
+    The characters are laid out as an n × len(template) grid of single characters and viewed as n strings without a Python loop.
+    '''
+    lows    = {'#': 0, '%': 1, '$': 2}
+    columns = [rng.integers(lows[char], 10, n).astype('U1') if char in lows else np.full(n, char) for char in template]
+
+    return np.ascontiguousarray(np.stack(columns, axis = 1)).view(f'U{len(template)}').ravel()
+
+
+def numerify_formats(formats, n, rng):
+    '''
+    Pick one of the formats for each of n rows and numerify each group of rows together.
+    '''
+    choice = rng.integers(0, len(formats), n)
+    output = np.empty(n, dtype = f'U{max(map(len, formats))}')
+
+    for i, template in enumerate(formats):
+
+        rows         = choice == i
+        output[rows] = numerify(template, rows.sum(), rng)
+
+    return output
+
+
+def assemble_identities(pools, n, seed):
+    '''
+    Assemble n identities from the component pools with a generator seeded for this shard.
+    '''
+    rng  = np.random.default_rng(seed)
+    pick = lambda pool: pool[rng.integers(0, len(pool), n)]
+    join = lambda *parts: reduce(np.char.add, parts)
+
+    prefixes = np.where(rng.random(n) < 0.02,  np.char.add(pick(pools['prefixes']), ' '), '')
+    suffixes = np.where(rng.random(n) < 0.025, np.char.add(' ', pick(pools['suffixes'])), '')
+    names    = join(prefixes, pick(pools['first_names']), ' ', pick(pools['last_names']), suffixes)
+
+    streets     = np.where(rng.random(n) < 0.5, pick(pools['first_names']), pick(pools['last_names']))
+    secondaries = np.where(rng.random(n) < 0.5, np.char.add(' ', numerify_formats(pools['secondary_formats'], n, rng)), '')
+    addresses   = join(numerify_formats(pools['building_formats'], n, rng), ' ', streets, ' ', pick(pools['street_suffixes']), secondaries)
+
+    return {'customer_name' : names,
+            'phone'         : numerify_formats(pools['phone_formats'], n, rng),
+            'address'       : addresses}
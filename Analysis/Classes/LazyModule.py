@@ -0,0 +1,43 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  LazyModule
+
+This script defers importing a module until one of its attributes is first used, so Utilities can export plotting and notebook
+dependencies (e.g. `plt`) without making every generator pay for matplotlib, seaborn, or IPython at import time.
+
+Usage:
+    plt = LazyModule('matplotlib.pyplot')
+    plt.subplots()                          # matplotlib.pyplot is imported here, then reused
+
+Considerations:
+    After the first access, the proxy forwards every attribute lookup to the imported module, which stays cached in sys.modules.
+    is_loaded() reports whether the import has happened yet, which the import-time benchmark uses to check headless imports.
+'''
+
+import importlib
+import sys
+
+class LazyModule:
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.module      = None
+
+    # Accessors
+    def get_module(self):
+        if self.module is None:
+            self.module = importlib.import_module(self.module_name)
+
+        return self.module
+
+    def is_loaded(self):
+        return self.module is not None or self.module_name in sys.modules
+
+    def __getattr__(self, name):
+        return getattr(self.get_module(), name)
+
+    def __dir__(self):
+        return dir(self.get_module())
+
+    def __repr__(self):
+        return f"<LazyModule '{self.module_name}' ({'loaded' if self.is_loaded() else 'not loaded'})>"
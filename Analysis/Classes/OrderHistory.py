@@ -7,7 +7,7 @@ This script generates a randomized dataset of order history information. The dat
 be saved as a CSV file or used directly as a pandas DataFrame.
 
 Schema:
-    order_id (varchar):       A unique identifier for each order
+    order_id (varchar):       A unique identifier for each order, drawn from an IdAllocator so it never repeats
     order_date (timestamp):   The date when the order was placed
     shipped_date (timestamp): The date when the order was shipped
     status (string):          The status of the order (abandoned, canceled, or completed)
@@ -18,26 +18,57 @@ Schema:
 
 Considerations:
     `shipped_date` should generally be 1 to 2 business days after order_date.
+    Weekends and holidays come from a ShippingCalendar built once for every year in the date range.
     `order_amount` is the total dollar amount of a user's cart (online basket).
     Status gives insight into whether or not the order was abandoned, canceled, or completed.
     The values in `order_amount` should emulate the average expected for an iheartjane.com purchase.
-    The values for `customer_id` are predicated upon a user averaging 4 orders over a 6-month period
+    The values for `customer_id` come from customer segments, each a share of customers and the number of orders each of them places.
+    The default is 5% of customers with 20 orders, 35% with 4, and 60% with 1. get_zipf_segments gives a heavier-tailed alternative.
+    The number of customers is num_orders divided by the segments' mean orders per customer, e.g. 3 for the default segments.
+    The columnar engine draws every field as a NumPy array from a single seeded generator, which is the default for __call__.
+    For very large runs, stream() writes the orders in chunks and externally sorts them by order_id, so memory stays bounded by the chunk size.
+    Passing workers to __call__ splits the orders into seeded shards, producing the same records for any number of processes.
+    A seeded __call__ always uses these shards, so OrderHistory(..., seed = 7)() is reproducible with or without workers.
+    append() and feed() extend the dataset with orders for the days after end_date, drawn from the same customer pool, and append them
+    to the existing CSV and SQLite table without rewriting any existing rows.
+    Every full load of the SQLite table also writes `order_history_state`, the id allocator keys, pool seed, and parameters the
+    orders were generated with, so append() in a later session continues the same ids and customers even when unseeded.
+    Every load of the SQLite table also refreshes the `store_daily_sales` SalesReport, fully after __call__ and stream(), and only
+    for the appended months after append() and feed().
+    Order and customer ids have 7 digits, or more when the dataset is large enough that 7 digits couldn't hold 10 times num_orders
+    (see get_id_digits), so appended orders have room to grow.
 '''
 
-from datetime    import date, timedelta
-from collections import defaultdict
-from .Utilities  import *
-import random    as rn
-import numpy     as np
-import holidays  as hd
+from copy              import copy
+from datetime          import date, timedelta
+from .IdAllocator      import IdAllocator
+from .SalesReport      import SalesReport
+from .ShippingCalendar import ShippingCalendar
+from .Utilities        import *
+import random          as rn
+import numpy           as np
+import json
+import time
 
 class OrderHistory:
-    def __init__(self, revenue, aov, start_date, end_date):
+    def __init__(self, revenue, aov, start_date, end_date, seed = None, segments = ((0.05, 20), (0.35, 4), (0.60, 1))):
         self.num_orders = revenue // aov
         self.revenue    = revenue
         self.aov        = aov
         self.start_date = start_date
         self.end_date   = end_date
+        self.seed       = seed
+        self.segments   = segments
+        self.rng        = np.random.default_rng(seed)
+
+        # Collision-free order and customer ids, and the customer assignment, keyed by their own child seeds
+        seeds                                = np.random.SeedSequence(seed)
+        order_seed, customer_seed, pool_seed = seeds.spawn(3)
+        self.entropy                         = seeds.entropy
+        self.id_digits                       = self.get_id_digits()
+        self.order_ids                       = IdAllocator(10 ** (self.id_digits - 1), 10 ** self.id_digits, order_seed)
+        self.customer_ids                    = IdAllocator(10 ** (self.id_digits - 1), 10 ** self.id_digits, customer_seed)
+        self.pool_rng                        = np.random.default_rng(pool_seed)
 
         # Optimized variables for faster mutator performance
         self.peak_days     = [date(2022,  4, 20), # Obviously
@@ -49,31 +80,61 @@ class OrderHistory:
                               date(2022, 12, 20), # Christmas
                               date(2022, 12, 26), # New Year's Eve
                               date(2022, 12, 27)] # New Year's Day
-        self.dates         = self.calculate_dates()
-        self.customer_pool = self.set_customer_pool()
+        self.statuses       = ['completed', 'abandoned', 'canceled']
+        self.status_weights = [0.87, 0.1, 0.03]
+        self.dates          = self.calculate_dates()
+        self.customer_pool  = self.set_customer_pool()
+        self.calendar       = ShippingCalendar(min(self.dates), max(self.dates))
+
+        # Array equivalents of the variables above for the columnar engine
+        self.date_array     = np.array(self.dates,     dtype = 'datetime64[D]')
+        self.peak_array     = np.array(self.peak_days, dtype = 'datetime64[D]')
+        self.customer_array = self.set_customer_assignment()
+
+        # Declared SQLite table, schema, and the indexes built after each load
+        self.sql_table   = 'order_history'
+        self.sql_schema  = {'order_id'     : 'TEXT PRIMARY KEY',
+                            'order_date'   : 'DATE',
+                            'shipped_date' : 'DATE',
+                            'status'       : 'TEXT',
+                            'comments'     : 'TEXT',
+                            'order_amount' : 'REAL',
+                            'customer_id'  : 'INTEGER',
+                            'store_id'     : 'TEXT'}
+        self.sql_indexes = [('customer_id', 'order_date'), ('store_id', 'order_date'), 'order_date']
+        self.state_table = 'order_history_state'
+
+        # Compact in-memory dtypes applied by to_dataframe
+        self.dtypes = {'order_date'   : 'datetime64[s]',
+                       'shipped_date' : 'datetime64[s]',
+                       'status'       : 'category',
+                       'comments'     : 'category',
+                       'customer_id'  : 'int32' if self.id_digits <= 9 else 'int64',
+                       'store_id'     : 'category'}
+
+        # The generated orders are cached so every accessor describes the same dataset that was persisted
+        self.orders       = None
+        self.order_totals = None
+
+        # State for appended orders: batches not yet merged into self.orders, and the last order date
+        self.appended  = []
+        self.last_date = end_date
 
     # Mutators
     def set_order_id(self):
-        return f'O{rn.randint(1000000, 9999999)}'
+        return f'O{self.order_ids.get_ids(1)[0]}'
 
     def set_order_date(self):
         return rn.choice(self.dates)
 
     def set_shipped_date(self, order_date):
-        shipped_date = order_date + timedelta(days=rn.randint(1, 2))
-        holidays_2022 = hd.US(years=2022)
-
-        # Add one day to shipped_date until it is not a weekend or holiday
-        shipped_date += timedelta(days = sum([1 for _ in range(3) \
-                                             if shipped_date.weekday() >= 5 or shipped_date in holidays_2022]))
-
-        return shipped_date
+        return self.calendar.get_shipped_date(order_date, rn.randint(1, 2))
 
     def set_status(self):
-        return rn.choices(['completed', 'abandoned', 'canceled'], [0.87, 0.1, 0.03])[0]
+        return rn.choices(self.statuses, self.status_weights)[0]
 
     def set_comments(self, order_date):
-        return 'Holiday Promotion' if order_date in hd.US(years = 2022) else ''
+        return 'Holiday Promotion' if self.calendar.is_holiday(order_date) else ''
 
     def set_order_amount(self, order_date):
         '''
@@ -97,17 +158,209 @@ class OrderHistory:
 
         return round(np.random.normal(self.aov * spike_multiplier * peak_multiplier, 15), 2)
 
-    def set_customer_id(self):
-        return rn.choice(self.customer_pool)
+    def set_customer_id(self, position):
+        return self.customer_array[position]
 
 
     def set_store_id(self):
         return f'S{rn.randint(1, 500)}'
-    
+
+    # Columnar Mutators
+    def set_order_ids(self, n, position = None):
+        return np.char.add('O', self.order_ids.get_ids(n, position).astype(str))
+
+    def set_order_dates(self, n):
+        return self.rng.choice(self.date_array, n)
+
+    def set_shipped_dates(self, order_dates):
+        return self.calendar.get_shipped_dates(order_dates, self.rng.integers(1, 3, len(order_dates)))
+
+    def set_statuses(self, n):
+        return self.rng.choice(self.statuses, n, p = self.status_weights)
+
+    def set_holiday_comments(self, order_dates):
+        return np.where(self.calendar.get_holiday_flags(order_dates), 'Holiday Promotion', '')
+
+    def set_order_amounts(self, order_dates):
+        '''
+        Array version of set_order_amount. Spikes are drawn for 1 in every 30 orders, and the peak multiplier walks the peak days
+        in reverse so the first matching day in self.peak_days wins, exactly as the row-wise `break` does.
+        '''
+        n                = len(order_dates)
+        spike_multiplier = np.where(self.rng.random(n) < 1 / 30, self.rng.uniform(2, 4, n), 1)
+
+        peak_multiplier = np.ones(n)
+        for day in self.peak_array[::-1]:
+
+            days_diff       = (day - order_dates).astype(int)
+            peak_multiplier = np.where((-10 <= days_diff) & (days_diff <= 0), 1 + 0.2 * np.abs(days_diff), peak_multiplier)
+
+        return np.round(self.rng.normal(self.aov * spike_multiplier * peak_multiplier, 15), 2)
+
+    def set_customer_ids(self, n, position = None):
+        '''
+        Return the customers assigned to the n orders starting at position. Orders past the end of the assignment, such as
+        appended orders (position = None), draw repeat customers from the assignment instead.
+        '''
+        assigned = self.customer_array[position:position + n] if position is not None else self.customer_array[:0]
+        if len(assigned) < n:
+            assigned = np.concatenate([assigned, self.rng.choice(self.customer_array, n - len(assigned))])
+
+        return assigned
+
+    def set_store_ids(self, n):
+        return np.char.add('S', self.rng.integers(1, 501, n).astype(str))
+
+    def set_orders(self, orders, state = None):
+        '''
+        Adopt previously generated orders (e.g. from DatasetCache) as this dataset. The customer pool and assignment are rebuilt
+        from their customer_ids, so CustomerInfo and appended orders use the customers that are actually in the orders.
+        Passing the state returned by get_cache_state when the orders were generated restores the id allocators' keys and the pool
+        seed, so appended orders continue the same order_id permutation even when this object is unseeded.
+        '''
+        if state is not None:
+            self.order_ids.keys    = np.array(state['order_keys'],    dtype = np.uint64)
+            self.customer_ids.keys = np.array(state['customer_keys'], dtype = np.uint64)
+            self.entropy           = state['entropy']
+
+        self.orders         = orders
+        self.order_totals   = None
+        self.appended       = []
+        self.last_date      = self.end_date
+        self.customer_pool  = orders['customer_id'].to_numpy()
+        self.customer_array = self.customer_pool
+
+    def set_pool_entropy(self, entropy):
+        '''
+        Rebuild the customer pool and assignment from the SeedSequence entropy they were drawn with, using the current customer keys.
+        '''
+        self.entropy               = entropy
+        self.pool_rng              = np.random.default_rng(np.random.SeedSequence(entropy).spawn(3)[2])
+        self.customer_ids.position = 0
+        self.customer_pool         = self.set_customer_pool()
+        self.customer_array        = self.set_customer_assignment()
+
+    def set_append_state(self):
+        '''
+        Continue after every order already in the SQLite table, including batches appended in an earlier session: the id allocator
+        keys and customer pool are restored from `order_history_state`, the next order_id position is the table's row count, and
+        the next order date follows its latest order_date.
+
+        Considerations:
+            Appended ids take consecutive positions after num_orders, so the row count is always the next unused position.
+            Only an unseeded object that hasn't generated or loaded orders of its own adopts the saved keys and pool. Any other
+            mismatch, like different parameters or seed, or a table without a saved state, raises instead of appending to it.
+        '''
+        loader = get_loader()
+        if not loader.has_table(self.sql_table):
+            return
+
+        saved = self.get_saved_state()
+        state = self.get_table_state()
+        fresh = self.seed is None and self.orders is None and self.order_totals is None
+        if saved != state:
+            if saved['parameters'] != state['parameters'] or not fresh:
+                raise ValueError(f'{self.sql_table} was generated by a different OrderHistory, so appending to it could repeat its ids '
+                                 f'or reference customers it doesn\'t have')
+
+            self.order_ids.keys    = np.array(saved['order_keys'],    dtype = np.uint64)
+            self.customer_ids.keys = np.array(saved['customer_keys'], dtype = np.uint64)
+            self.set_pool_entropy(saved['entropy'])
+
+        rows, last_date         = loader.connection.execute(f'SELECT COUNT(*), MAX(order_date) FROM {self.sql_table}').fetchone()
+        self.order_ids.position = max(self.order_ids.position, self.num_orders, rows)
+        if last_date is not None:
+            self.last_date = max(self.last_date, date.fromisoformat(last_date[:10]))
+
+    def set_appended_dates(self, n, first_date, last_date):
+        '''
+        Draw n order dates between first_date and last_date, weighting any peak days in that range 5x as calculate_dates does.
+        '''
+        days  = np.arange(np.datetime64(first_date, 'D'), np.datetime64(last_date, 'D') + 1)
+        peaks = self.peak_array[(self.peak_array >= days[0]) & (self.peak_array <= days[-1])]
+
+        return self.rng.choice(np.concatenate([days] + [peaks] * 4), n)
+
     # Accessors
+    def get_id_digits(self, headroom = 10):
+        '''
+        Return the number of digits the order and customer ids need, so that the range of ids with that many digits holds headroom
+        times num_orders: the dataset's own orders, plus up to headroom - 1 times as many appended or fed orders. Never fewer than 7.
+        '''
+        digits = 7
+        while 9 * 10 ** (digits - 1) < headroom * self.num_orders:
+            digits += 1
+
+        return digits
+
     def get_customer_ids(self):
-        return set(self.customer_pool)
+        '''
+        Return the ids of the customers that place at least one of the dataset's orders.
+        '''
+        return np.unique(self.customer_array)
+
+    def get_cache_state(self):
+        '''
+        Return the id allocators' round keys and the pool seed's entropy, which DatasetCache stores with the orders and passes back to set_orders.
+        '''
+        return {'order_keys'    : self.order_ids.keys.tolist(),
+                'customer_keys' : self.customer_ids.keys.tolist(),
+                'entropy'       : self.entropy}
+
+    def get_table_state(self):
+        '''
+        Return the cache state together with the parameters that size the customer pool, as saved in `order_history_state`.
+        '''
+        return {**self.get_cache_state(),
+                'parameters' : {name: repr(getattr(self, name)) for name in ('revenue', 'aov', 'start_date', 'end_date', 'segments')}}
+
+    def get_saved_state(self):
+        '''
+        Return the state saved in `order_history_state` by the last full load of the SQLite table.
+        '''
+        loader = get_loader()
+        if not loader.has_table(self.state_table):
+            raise ValueError(f'{self.sql_table} has no {self.state_table}, so its id keys and customer pool can\'t be restored. '
+                             f'Regenerate it before appending')
+
+        return {name: json.loads(value) for name, value in loader.connection.execute(f'SELECT name, value FROM {self.state_table}')}
+
+    @staticmethod
+    def get_zipf_segments(exponent = 2.0, max_orders = 50):
+        '''
+        Return segments where the share of customers placing k orders falls off as k ** -exponent, for k from 1 to max_orders.
+        A lower exponent gives more heavy users, e.g. OrderHistory(..., segments = OrderHistory.get_zipf_segments(1.5)).
+        '''
+        orders = np.arange(1, max_orders + 1)
+        shares = orders ** -float(exponent)
+        return tuple(zip((shares / shares.sum()).tolist(), orders.tolist()))
+
+    def get_orders(self):
+        '''
+        Return the cached orders DataFrame, generating it with the columnar engine only if __call__ has not run yet.
+        Appended batches are merged in the first time the orders are read after an append.
+        '''
+        if self.orders is None:
+            self.orders = pd.DataFrame(self.generate_orders())
+
+        if self.appended:
+            self.orders   = optimize_dtypes(pd.concat([self.orders, *self.appended], ignore_index = True), self.dtypes)
+            self.appended = []
+
+        return self.orders
+
+    def get_order_totals(self):
+        '''
+        Return each customer's total order amount. Streamed runs accumulate these totals chunk by chunk, since their orders aren't cached.
+        '''
+        if self.order_totals is None:
+            self.order_totals = self.get_orders().groupby('customer_id')['order_amount'].sum()
+
+        return self.order_totals
     
+    def get_daily_orders(self):
+        return self.num_orders / ((self.end_date - self.start_date).days + 1)
+
     def get_spend_weights(self):
         '''
         Calculate weights for each customer based on their total order amounts.
@@ -117,21 +370,21 @@ class OrderHistory:
         
         Returns:
             dict: A dictionary with customer IDs as keys and their corresponding weights as values.
-        '''
-        order_totals = defaultdict(float)
-        for order in self.generate_data():
-            order_totals[order['customer_id']] += order['order_amount']
 
-        max_total = max(order_totals.values())
-        return {k: 1 + 2 * (v / max_total) for k, v in order_totals.items()}
+        Considerations:
+            The totals come from the cached orders, so the weights describe the same orders that were saved to `order_history`.
+        '''
+        order_totals = self.get_order_totals()
+        return (1 + 2 * (order_totals / order_totals.max())).to_dict()
 
     # Prescriptive Methods
     def generate_data(self):
         '''
         Generate a list of dictionaries with randomized order history data.
         '''
-        data = []
-        for _ in range(self.num_orders):
+        data                    = []
+        self.order_ids.position = 0
+        for i in range(self.num_orders):
 
             order_date = self.set_order_date()
             order_record = {'order_id'     : self.set_order_id(),
@@ -140,13 +393,113 @@ class OrderHistory:
                             'status'       : self.set_status(),
                             'comments'     : self.set_comments(order_date),
                             'order_amount' : self.set_order_amount(order_date),
-                            'customer_id'  : self.set_customer_id(),
+                            'customer_id'  : self.set_customer_id(i),
                             'store_id'     : self.set_store_id()}
             
             data.append(order_record)
 
         return data
+
+    def generate_columns(self, num_orders = None, position = None):
+        '''
+        Generate a dictionary of NumPy arrays with randomized order history data, using the same schema and distributions as generate_data.
+
+        Considerations:
+            Each column is drawn in one vectorized call from self.rng, so a fixed seed reproduces the same dataset.
+            Dates stay as datetime64 arrays rather than datetime.date objects, which is what the dtype plan in to_dataframe expects.
+            The dataset's orders always take the first num_orders ids, so a full run restarts the order_id sequence, and
+            position lets a shard take its own slice of the sequence. Customers follow the same positions in the shuffled assignment.
+        '''
+        n           = self.num_orders if num_orders is None else num_orders
+        order_dates = self.set_order_dates(n)
+
+        if num_orders is None:
+            self.order_ids.position = 0
+        start = self.order_ids.position if position is None else position
+
+        return {'order_id'     : self.set_order_ids(n, position),
+                'order_date'   : order_dates,
+                'shipped_date' : self.set_shipped_dates(order_dates),
+                'status'       : self.set_statuses(n),
+                'comments'     : self.set_holiday_comments(order_dates),
+                'order_amount' : self.set_order_amounts(order_dates),
+                'customer_id'  : self.set_customer_ids(n, start),
+                'store_id'     : self.set_store_ids(n)}
     
+    def generate_chunks(self, chunk_size = 1000000):
+        '''
+        Yield DataFrames of chunk_size randomized orders from the columnar engine until num_orders have been generated.
+
+        Considerations:
+            Per-customer totals are accumulated as each chunk is generated, so get_spend_weights still works after a streamed run.
+        '''
+        totals                  = pd.Series(dtype = float)
+        self.order_ids.position = 0
+        for start in range(0, self.num_orders, chunk_size):
+
+            chunk  = pd.DataFrame(self.generate_columns(min(chunk_size, self.num_orders - start)))
+            totals = totals.add(chunk.groupby('customer_id')['order_amount'].sum(), fill_value = 0)
+            yield chunk
+
+        self.orders       = None
+        self.order_totals = totals
+        self.appended     = []
+        self.last_date    = self.end_date
+
+    def generate_shard(self, shard, seed):
+        '''
+        Generate a DataFrame of orders from the columnar engine, using a copy of this object whose generator is seeded for this shard.
+        The shard is a (position, num_orders) pair, so its order_ids are its own slice of the dataset's id sequence.
+        '''
+        position, num_orders = shard
+        worker               = copy(self)
+        worker.rng           = np.random.default_rng(seed)
+        return pd.DataFrame(worker.generate_columns(num_orders, position))
+
+    def generate_parallel(self, workers = None, shard_size = 1000000):
+        '''
+        Generate every order in shards of shard_size orders, each with a seed spawned from self.seed.
+        '''
+        shards = [(start, min(shard_size, self.num_orders - start)) for start in range(0, self.num_orders, shard_size)]
+        self.order_ids.position = self.num_orders
+
+        return generate_shards(self.generate_shard, shards, self.seed, workers)
+
+    def generate_orders(self, columnar = True, workers = None):
+        '''
+        Generate the dataset's orders with the engine __call__ selects: the seeded shards when workers or a seed are given, so a seed
+        produces the same orders for any number of workers, and otherwise the columnar engine or, with columnar = False, generate_data.
+        '''
+        if workers or (columnar and self.seed is not None):
+            return self.generate_parallel(workers)
+
+        return self.generate_columns() if columnar else self.generate_data()
+
+    def generate_appended(self, n, first_date, last_date):
+        '''
+        Generate a DataFrame of n new orders dated between first_date and last_date, with unique order_ids and customers from the existing pool.
+
+        Considerations:
+            The ShippingCalendar is rebuilt whenever the new dates run past it, so shipped dates still skip weekends and holidays.
+            It keeps its first day, which can be a peak day before start_date, so every earlier order date stays inside it.
+            New ids continue the order_id sequence after the dataset's own num_orders, so they can't repeat an existing order.
+        '''
+        if np.datetime64(last_date, 'D') > self.calendar.days[-1]:
+            self.calendar = ShippingCalendar(self.calendar.start_date, last_date)
+
+        self.order_ids.position = max(self.order_ids.position, self.num_orders)
+
+        order_dates = self.set_appended_dates(n, first_date, last_date)
+        return optimize_dtypes(pd.DataFrame({'order_id'     : self.set_order_ids(n),
+                                             'order_date'   : order_dates,
+                                             'shipped_date' : self.set_shipped_dates(order_dates),
+                                             'status'       : self.set_statuses(n),
+                                             'comments'     : self.set_holiday_comments(order_dates),
+                                             'order_amount' : self.set_order_amounts(order_dates),
+                                             'customer_id'  : self.set_customer_ids(n),
+                                             'store_id'     : self.set_store_ids(n)}),
+                               self.dtypes)
+
     def calculate_dates(self):
         '''
         Pre-calculating these dates for faster selection when generating the data.
@@ -158,31 +511,201 @@ class OrderHistory:
     
     def set_customer_pool(self):
         """
-        Generate a pool of customer IDs with the desired distribution:
+        Generate a pool of customer IDs with the distribution in self.segments, where each (share, orders) pair gives
+        a share of customers and the number of orders each of them places. By default:
         - 5% of users to get 20 order records
         - 35% of users to get 4 order records
         - 60% of users to get only 1 order record
+
+        The number of customers is num_orders divided by the segments' mean orders per customer (shares @ orders), so the
+        pool holds about num_orders entries, each customer id repeated once per order in its segment. The customer ids come
+        from an IdAllocator, so no two customers share an id.
         """
-        percentages = [0.05, 0.35, 0.60]
-        orders_list = [20, 4, 1]
+        shares, orders = np.array(self.segments, dtype = float).T
+        shares         = shares / shares.sum()
+        customers      = np.round(shares * self.num_orders / (shares @ orders)).astype(int)
 
-        pool = [
-            customer_id
-            for percentage, num_orders in zip(percentages, orders_list)
-            for _ in range(int(percentage * self.num_orders // 4))
-            for customer_id in [rn.randint(1000000, 9999999)] * num_orders
-        ]
+        ids = self.customer_ids.get_ids(customers.sum())
+        return np.repeat(ids, np.repeat(orders.astype(int), customers))
 
-        return pool
+    def set_customer_assignment(self):
+        '''
+        Shuffle the customer pool into exactly num_orders entries, so the customer of the k-th order is entry k.
+        Rounding the customer counts can leave the pool a few entries short, and those are drawn from the pool, or a few entries
+        over, and those are left out, so the segment mix is unchanged.
+        '''
+        pool    = self.customer_pool
+        missing = self.num_orders - len(pool)
+        if missing > 0:
+            pool = np.concatenate([pool, self.pool_rng.choice(pool, missing)])
+
+        return self.pool_rng.permutation(pool)[:self.num_orders]
     
-    def __call__(self):
+    def __call__(self, columnar = True, workers = None, fmt = 'csv'):
         '''
         Generate a pandas DataFrame of randomized order history information.
+
+        Considerations:
+            The columnar engine is used by default. Passing columnar = False falls back to the original row-by-row generate_data.
+            Passing workers uses the sharded, seeded engine. workers = 1 runs the same shards in this process with identical output.
+            A seed also selects the sharded engine for the columnar default, running its shards in this process, so the same seed
+            gives the same orders for any number of workers.
+            fmt can be 'csv', 'parquet', or 'feather', and the file can be reloaded with load_dataframe.
+            When the shared profiler is enabled, a summary of mutator and persistence costs is printed at the end.
         '''
-        df = to_dataframe(data      = self.generate_data(),
-                          by        = ['order_id'],
-                          add_id    = False,
-                          filename  = save_path(True, 'Data', 'order_history.csv'),
-                          sql_table = 'order_history')
+        with profiler.step(f'{type(self).__name__}.generate'):
+            data = self.generate_orders(columnar, workers)
+
+        df = to_dataframe(data        = data,
+                          by          = ['order_id'],
+                          add_id      = False,
+                          filename    = save_path(True, 'Data', f'{self.sql_table}.{fmt}'),
+                          sql_table   = self.sql_table,
+                          sql_schema  = self.sql_schema,
+                          sql_indexes = self.sql_indexes,
+                          dtypes      = self.dtypes)
+
+        self.orders       = df
+        self.order_totals = None
+        self.appended     = []
+        self.last_date    = self.end_date
+
+        self.save_state()
+        self.refresh_reports()
+        profiler.report('OrderHistory')
+        return df
+
+    def stream(self, chunk_size = 1000000, pipelined = False):
+        '''
+        Write orders to CSV and SQLite one chunk at a time instead of building a single DataFrame.
+        Order ids are random, so the chunks are externally sorted by order_id on the way out. Returns the number of rows written.
+        Passing pipelined = True writes the CSV and SQLite table in their own threads while the next chunks are generated.
+        '''
+        rows = write_chunks(chunks      = self.generate_chunks(chunk_size),
+                            by          = ['order_id'],
+                            add_id      = False,
+                            filename    = save_path(True, 'Data', f'{self.sql_table}.csv'),
+                            sql_table   = self.sql_table,
+                            sql_schema  = self.sql_schema,
+                            sql_indexes = self.sql_indexes,
+                            chunk_size  = chunk_size,
+                            pipelined   = pipelined)
+
+        self.save_state()
+        self.refresh_reports()
+        return rows
+
+    def save_state(self):
+        '''
+        Replace `order_history_state` with the state of the orders just loaded into the SQLite table, one JSON value per name.
+        '''
+        state = self.get_table_state()
+        get_loader().load(self.state_table,
+                          pd.DataFrame({'name' : list(state), 'value' : [json.dumps(value) for value in state.values()]}),
+                          {'name' : 'TEXT PRIMARY KEY', 'value' : 'TEXT'})
+
+    def refresh_reports(self, since = None):
+        '''
+        Rebuild the `store_daily_sales` SalesReport from the SQLite table, fully or from the month containing since.
+        '''
+        with profiler.step('OrderHistory.reports'):
+            SalesReport(source = self.sql_table).refresh(since)
+
+    def write_appended(self, batch, persist = True):
+        '''
+        Append a batch of new orders to the CSV and SQLite table, and fold it into the cached orders or the streamed totals.
+        The SQLite insert runs first, in an ordinary journaled transaction rather than under the bulk-load pragmas, so a batch
+        the table rejects is rolled back and never written to the CSV either.
+        '''
+        if persist:
+            loader = get_loader()
+            if not loader.has_table(self.sql_table):
+                loader.create(self.sql_table, batch, self.sql_schema)
+                loader.index(self.sql_table, self.sql_indexes)
+                self.save_state()
+
+            loader.insert(self.sql_table, batch)
+            write_chunks(chunks      = [batch],
+                         add_id      = False,
+                         filename    = save_path(True, 'Data', f'{self.sql_table}.csv'),
+                         append      = True)
+
+            self.refresh_reports(since = batch['order_date'].min())
+
+        if self.orders is None and self.order_totals is not None:
+            self.order_totals = self.order_totals.add(batch.groupby('customer_id')['order_amount'].sum(), fill_value = 0)
+        else:
+            self.appended.append(batch)
+            self.order_totals = None
+
+    def append(self, days = 1, orders_per_day = None, persist = True):
+        '''
+        Extend the dataset with orders for the given number of days after the last order date.
+
+        Args:
+            days (int, optional): The number of new days of orders. Defaults to 1.
+            orders_per_day (float, optional): The number of orders per new day. Defaults to the dataset's own daily rate.
+            persist (bool, optional): Append the new orders to the CSV and SQLite table. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The new orders, sorted by order_id.
+
+        Considerations:
+            Existing rows are never rewritten, so the CSV is only sorted by order_id within the original data and each appended batch.
+            When persisted, the `store_daily_sales` SalesReport is refreshed for the months the new orders fall in.
+            When persisted, the id keys and customer pool are restored from `order_history_state` and the new orders start after
+            every order already in the table (see set_append_state), so a new session continues the same ids, customers, and dates.
+            A table without a saved state, or one generated with different parameters or a different seed, raises instead.
+        '''
+        if persist:
+            self.set_append_state()
+
+        first_date = self.last_date + timedelta(days = 1)
+        last_date  = self.last_date + timedelta(days = days)
+        n          = round((orders_per_day or self.get_daily_orders()) * days)
+        batch      = self.generate_appended(n, first_date, last_date).sort_values('order_id', ignore_index = True)
+
+        self.write_appended(batch, persist)
+        self.last_date = last_date
+        return batch
+
+    def feed(self, rate, batch_size = 1000, batches = None, persist = True):
+        '''
+        Yield batches of new orders at a target rate of orders per second, to benchmark downstream consumers against a live feed.
+
+        Args:
+            rate (float): The target number of orders per second.
+            batch_size (int, optional): The number of orders in each batch. Defaults to 1,000.
+            batches (int, optional): Stop after this many batches. Defaults to an endless feed.
+            persist (bool, optional): Append each batch to the CSV and SQLite table before it is yielded. Defaults to True.
+
+        Considerations:
+            Simulated days advance by one for every get_daily_orders() orders, so each batch is dated on the day(s) the feed has reached.
+            Batches are paced against a schedule, so time spent by the consumer counts toward the interval. A consumer that falls
+            behind gets the next batch immediately, and the schedule restarts from there instead of bursting to catch up.
+            When persisted, the feed starts after every order already in the table, as append() does.
+        '''
+        if persist:
+            self.set_append_state()
+
+        start    = self.last_date
+        daily    = self.get_daily_orders()
+        interval = batch_size / rate
+        position = 0.0
+        emitted  = 0
+        deadline = time.perf_counter()
+
+        while batches is None or emitted < batches:
+
+            first     = int(position)
+            position += batch_size / daily
+            last      = max(first, int(np.ceil(position)) - 1)
+            batch     = self.generate_appended(batch_size, start + timedelta(days = first + 1), start + timedelta(days = last + 1))
+
+            self.write_appended(batch, persist)
+            self.last_date = max(self.last_date, start + timedelta(days = last + 1))
+            yield batch
 
-        return df
\ No newline at end of file
+            emitted  += 1
+            deadline  = max(deadline + interval, time.perf_counter())
+            time.sleep(max(0, deadline - time.perf_counter()))
\ No newline at end of file
@@ -0,0 +1,136 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  Profiler
+
+This script records call counts and cumulative wall time for the generators' set_* mutators and for each persistence step of
+to_dataframe, so a slow run can be traced back to the column or step responsible. The shared instance is `Utilities.profiler`.
+
+Usage:
+    profiler.enable(OrderHistory, CustomerInfo)   # Wrap every set_* mutator on these classes (or on single instances)
+    OrderHistory(...)()                           # Each __call__ prints its summary and starts a fresh one
+    profiler.summary                              # The last summary as a DataFrame
+    profiler.disable()                            # Restore the original methods
+
+Considerations:
+    Nothing is wrapped until enable() is called, so a disabled profiler adds no per-row cost to the mutators.
+    The to_dataframe steps always pass through step(), which returns immediately when the profiler is disabled.
+    Times are cumulative, so a mutator that calls another mutator includes that call's time as well.
+    Work done in worker processes (e.g. generate_parallel with workers > 1) is not recorded.
+'''
+
+from contextlib import contextmanager
+from functools  import wraps
+import json
+import time
+import pandas   as pd
+
+class Profiler:
+    def __init__(self, prefix = 'set_'):
+        self.prefix  = prefix
+        self.enabled = False
+        self.fmt     = 'table'
+        self.stats   = {}
+        self.patched = []
+        self.summary = None
+
+    # Mutators
+    def set_wrapper(self, name, method):
+        '''
+        Return method wrapped so each call adds to the count and cumulative time recorded under name.
+        '''
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    # Accessors
+    def get_summary(self):
+        '''
+        Return the recorded stats as a DataFrame with one row per mutator or step, ordered by cumulative time.
+        '''
+        summary = pd.DataFrame([{'name'    : name,
+                                 'calls'   : calls,
+                                 'seconds' : seconds} for name, (calls, seconds) in self.stats.items()],
+                               columns = ['name', 'calls', 'seconds'])
+
+        summary['us_per_call'] = (summary['seconds'] / summary['calls'] * 1e6).round(2)
+        summary['seconds']     = summary['seconds'].round(4)
+
+        return summary.sort_values('seconds', ascending = False, ignore_index = True)
+
+    # Prescriptive Methods
+    def enable(self, *targets, fmt = 'table'):
+        '''
+        Start recording, wrapping every set_* method on each target class or instance. fmt ('table' or 'json') sets how summaries print.
+        '''
+        self.enabled = True
+        self.fmt     = fmt
+        for target in targets:
+
+            owner = target.__name__ if isinstance(target, type) else type(target).__name__
+            for name in dir(target):
+
+                method = getattr(target, name)
+                if name.startswith(self.prefix) and callable(method):
+                    self.patched.append((target, name, vars(target).get(name)))
+                    setattr(target, name, self.set_wrapper(f'{owner}.{name}', method))
+
+        return self
+
+    def disable(self):
+        '''
+        Stop recording and restore every wrapped method.
+        '''
+        for target, name, original in reversed(self.patched):
+            if original is None:
+                delattr(target, name)
+            else:
+                setattr(target, name, original)
+
+        self.patched = []
+        self.enabled = False
+        return self
+
+    def record(self, name, seconds):
+        calls, total     = self.stats.get(name, (0, 0.0))
+        self.stats[name] = (calls + 1, total + seconds)
+
+    @contextmanager
+    def step(self, name):
+        '''
+        Time the enclosed block under name while the profiler is enabled.
+        '''
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self, title = None):
+        '''
+        Print the summary as a table or JSON, keep it as self.summary, clear the recorded stats, and return it. Does nothing while disabled.
+        '''
+        if not self.enabled:
+            return None
+
+        self.summary = self.get_summary()
+        self.stats   = {}
+
+        if title:
+            print(title)
+        if self.fmt == 'json':
+            print(json.dumps({'title': title, 'stats': self.summary.to_dict(orient = 'records')}, indent = 2))
+        else:
+            print(self.summary.to_string(index = False))
+
+        return self.summary
@@ -0,0 +1,146 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  SQLiteLoader
+
+This script bulk loads pandas DataFrames into a SQLite database with a declared schema. One loader (and one connection) is kept
+per database file, so every generator that writes to `jane.db` reuses the same connection.
+
+Load Steps:
+    1. Drop and create the table with declared column types and primary keys, or types inferred from the DataFrame's dtypes.
+    2. Insert every row with executemany inside a single transaction, with the journal and synchronous writes turned off.
+    3. Build the requested indexes once the data is in place and refresh the query planner's statistics with ANALYZE.
+
+Considerations:
+    Dates are stored as ISO-8601 text and booleans as 0/1 integers, which is what SQLite's date functions and the notebook queries expect.
+    The bulk pragmas only apply while a load is running. The connection's previous settings (e.g. a WAL journal) are restored afterwards.
+    Rows are inserted by column name, so a DataFrame whose columns are in a different order than the table's still lines up.
+'''
+
+from contextlib import contextmanager
+import numpy    as np
+import pandas   as pd
+import sqlite3
+
+class SQLiteLoader:
+    def __init__(self, filename, cache_size = 200000):
+        self.filename   = filename
+        self.cache_size = cache_size
+        self.connection = sqlite3.connect(filename)
+
+    # Mutators
+    def set_schema(self, df, schema = None):
+        '''
+        Return the column → SQL type mapping for df, taking declared types from schema and inferring the rest from the dtypes.
+        '''
+        schema = schema or {}
+        return {column: schema.get(column, self.get_sql_type(df[column])) for column in df.columns}
+
+    # Accessors
+    def has_table(self, table):
+        return self.connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+    def get_sql_type(self, series):
+        if pd.api.types.is_bool_dtype(series):
+            return 'BOOLEAN'
+        if pd.api.types.is_integer_dtype(series):
+            return 'INTEGER'
+        if pd.api.types.is_float_dtype(series):
+            return 'REAL'
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'DATE'
+        return 'TEXT'
+
+    def get_date_strings(self, series):
+        '''
+        Format a column of dates as ISO-8601 strings. Dates repeat heavily, so each distinct value is only formatted once.
+        '''
+        codes, uniques = pd.factorize(series)
+        labels         = np.array([pd.Timestamp(value).strftime('%Y-%m-%d') for value in uniques] + [None], dtype = object)
+
+        return pd.Series(labels[codes], index = series.index)
+
+    def get_pragmas(self, names = ('journal_mode', 'synchronous', 'temp_store', 'cache_size')):
+        return {name: self.connection.execute(f'PRAGMA {name}').fetchone()[0] for name in names}
+
+    def get_rows(self, df):
+        '''
+        Convert df into row tuples of plain Python values that sqlite3 can bind directly.
+        '''
+        columns = []
+        for column in df.columns:
+
+            series = df[column]
+            if pd.api.types.is_datetime64_any_dtype(series) or (series.dtype == object and len(series) and hasattr(series.iloc[0], 'isoformat')):
+                series = self.get_date_strings(series)
+            elif pd.api.types.is_bool_dtype(series):
+                series = series.astype(int)
+            elif isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype(object)
+
+            if series.hasnans:
+                series = series.astype(object).where(series.notna(), None)
+
+            columns.append(series.tolist())
+
+        return zip(*columns)
+
+    # Prescriptive Methods
+    @contextmanager
+    def bulk(self):
+        '''
+        Apply the bulk-load pragmas for the duration of a load and restore the connection's previous settings afterwards.
+        '''
+        previous = self.get_pragmas()
+        self.connection.execute('PRAGMA journal_mode = OFF')
+        self.connection.execute('PRAGMA synchronous  = OFF')
+        self.connection.execute('PRAGMA temp_store   = MEMORY')
+        self.connection.execute(f'PRAGMA cache_size  = -{self.cache_size}')
+        try:
+            yield self.connection
+        finally:
+            for name, value in previous.items():
+                self.connection.execute(f'PRAGMA {name} = {value}')
+
+    def create(self, table, df, schema = None):
+        columns = ', '.join(f'"{column}" {sql_type}' for column, sql_type in self.set_schema(df, schema).items())
+        with self.connection:
+            self.connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self.connection.execute(f'CREATE TABLE "{table}" ({columns})')
+
+    def insert(self, table, df):
+        columns      = ', '.join(f'"{column}"' for column in df.columns)
+        placeholders = ', '.join('?' * len(df.columns))
+        with self.connection:
+            self.connection.executemany(f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders})', self.get_rows(df))
+
+    def index(self, table, indexes = ()):
+        '''
+        Create one index per entry in indexes, where each entry is a column name or a tuple of column names.
+        '''
+        with self.connection:
+            for columns in indexes:
+
+                columns = [columns] if isinstance(columns, str) else list(columns)
+                name    = f'idx_{table}_' + '_'.join(columns)
+                self.connection.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({", ".join(columns)})')
+
+            self.connection.execute(f'ANALYZE "{table}"')
+
+    def load(self, table, df, schema = None, indexes = ()):
+        '''
+        Replace table with the contents of df, inserting every row in a single transaction, then build its indexes.
+
+        Args:
+            table (str): The name of the SQL table.
+            df (pd.DataFrame): The data to load.
+            schema (dict, optional): Column → SQL type declarations, e.g. {'student_id': 'INTEGER PRIMARY KEY'}. Undeclared columns are inferred.
+            indexes (list, optional): Columns or tuples of columns to index after the load.
+        '''
+        with self.bulk():
+            self.create(table, df, schema)
+            self.insert(table, df)
+            self.index(table, indexes)
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,97 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  SalesReport
+
+This script maintains `store_daily_sales`, a materialized aggregate of the `order_history` table with one row per store and day.
+It replaces the correlated subquery for monthly sales to date, which re-scans every order in a store's month for each output row.
+
+Schema:
+    store_id (varchar):               The store where the orders were placed
+    date (timestamp):                 The order date
+    daily_sales (currency):           The total order amount for the store on that date
+    monthly_sales_to_date (currency): The running total of daily_sales from the first of the month through that date
+
+Considerations:
+    The running totals come from a single SUM() OVER window per store and month, so a full build is one scan of `order_history`.
+    Monthly totals only depend on orders from the same month, so refresh(since) rebuilds just the months on or after `since`.
+    The table is keyed by (store_id, date) without a rowid, so lookups for one store read a contiguous range.
+'''
+
+from .Utilities import *
+import pandas   as pd
+
+class SalesReport:
+    def __init__(self, loader = None, source = 'order_history', table = 'store_daily_sales'):
+        self.loader = loader or get_loader()
+        self.source = source
+        self.table  = table
+
+    # Mutators
+    def set_table(self):
+        with self.loader.connection as connection:
+            connection.execute(f'''CREATE TABLE IF NOT EXISTS {self.table}
+                                   (store_id              TEXT,
+                                    date                  DATE,
+                                    daily_sales           REAL,
+                                    monthly_sales_to_date REAL,
+                                    PRIMARY KEY (store_id, date)) WITHOUT ROWID''')
+
+            connection.execute(f'CREATE INDEX IF NOT EXISTS idx_{self.table}_date ON {self.table} (date)')
+
+    # Accessors
+    def get_report(self, store_id = None, start_date = None, end_date = None):
+        '''
+        Return the report as a DataFrame, optionally filtered to one store and a date range, ordered by store number and date.
+        '''
+        filters    = ['1 = 1']
+        parameters = {}
+        for column, operator, name, value in [('store_id', '=',  'store_id',   store_id),
+                                              ('date',     '>=', 'start_date', start_date),
+                                              ('date',     '<=', 'end_date',   end_date)]:
+            if value is not None:
+                filters.append(f'{column} {operator} :{name}')
+                parameters[name] = str(value)
+
+        return pd.read_sql(f'''SELECT store_id,
+                                      date,
+                                      daily_sales,
+                                      monthly_sales_to_date
+                                 FROM {self.table}
+                                WHERE {' AND '.join(filters)}
+                                ORDER BY CAST(SUBSTR(store_id, 2) AS INT), date''',
+                           self.loader.connection,
+                           params = parameters)
+
+    # Prescriptive Methods
+    def refresh(self, since = None):
+        '''
+        Rebuild the report from `order_history`, either fully or from the first day of the month containing `since`.
+
+        Args:
+            since (date or str, optional): The earliest order date that changed, e.g. the first date of newly appended orders.
+                                           Defaults to rebuilding every month.
+
+        Considerations:
+            Deleting and re-inserting whole months keeps the running totals correct, because no month depends on another.
+        '''
+        self.set_table()
+        start = str(since)[:8] + '01' if since is not None else '0000-01-01'
+
+        with self.loader.connection as connection:
+            connection.execute(f'DELETE FROM {self.table} WHERE date >= :start', {'start': start})
+            connection.execute(f'''INSERT INTO {self.table}
+                                   SELECT store_id,
+                                          order_date,
+                                          ROUND(daily_sales, 2),
+                                          ROUND(SUM(daily_sales) OVER (PARTITION BY store_id, SUBSTR(order_date, 1, 7)
+                                                                           ORDER BY order_date), 2)
+                                     FROM (SELECT store_id,
+                                                  order_date,
+                                                  SUM(order_amount) AS daily_sales
+                                             FROM {self.source}
+                                            WHERE order_date >= :start
+                                            GROUP BY store_id, order_date)''',
+                               {'start': start})
+
+        return self
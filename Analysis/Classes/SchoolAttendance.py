@@ -10,27 +10,52 @@ Schema:
     date (timestamp):     The date of the attendance record
     student_id (varchar): A unique identifier for each student
     attendance (boolean): A flag indicating whether the student attended school on the given date (True for attended, False for absent)
+    month_day (integer):  The month and day of date as month * 100 + day, indexed with student_id for birthday joins
 
 Data Constraints:
     Each student_id is represented across all dates and does not show up twice for the same date.
     The final DataFrame is ordered by date (ascending) and student_id (ascending).
     The number of rows is determined by the max_student_id ⋅ time_delta, which ensures all students are accounted for across all days.
+    For very large ranges, stream() writes the records in (student_id, date) chunks, so memory stays bounded by the chunk size.
+    Passing workers to __call__ splits the date range into seeded shards, producing the same records for any number of processes.
+    A seeded __call__ always uses these shards, so SchoolAttendance(..., seed = 3)() is reproducible with or without workers.
+    generate_matrix() keeps attendance as a bit-packed AttendanceMatrix, which is only expanded to these records on demand.
 '''
 
-from datetime   import timedelta
-from .Utilities import *
+from datetime          import timedelta
+from .AttendanceMatrix import AttendanceMatrix
+from .Utilities        import *
 import random   as rn
+import numpy    as np
 
 class SchoolAttendance:
-    def __init__(self, start_date, end_date, max_student_id):
+    def __init__(self, start_date, end_date, max_student_id, seed = None):
         self.start_date     = start_date
         self.end_date       = end_date
         self.max_student_id = max_student_id
+        self.seed           = seed
+        self.rng            = np.random.default_rng(seed)
 
         # Optimized variables for faster mutator performance
         self.attendance_weights = [True] * 4 + [False] # Ensures that True shows up 80% of the time
+        self.attendance_rate    = self.attendance_weights.count(True) / len(self.attendance_weights)
         self.dates              = self.calculate_dates()
 
+        # Declared SQLite table, schema, and the indexes built after each load
+        self.sql_table   = 'school_attendance'
+        self.sql_schema  = {'id'         : 'INTEGER PRIMARY KEY',
+                            'date'       : 'DATE',
+                            'student_id' : 'INTEGER',
+                            'attendance' : 'BOOLEAN',
+                            'month_day'  : 'INTEGER'}
+        self.sql_indexes = [('student_id', 'date'), ('student_id', 'month_day'), 'date']
+
+        # Compact in-memory dtypes applied by to_dataframe
+        self.dtypes = {'date'       : 'datetime64[s]',
+                       'student_id' : 'int32',
+                       'attendance' : 'bool',
+                       'month_day'  : 'int16'}
+
     # Mutators
     def set_student_ids(self):
         return [s for s in range(1, self.max_student_id + 1)]
@@ -61,12 +86,72 @@ class SchoolAttendance:
 
                 attendance_record = {'date'       : date,
                                      'student_id' : student_id,
-                                     'attendance' : self.set_random_attendance()}
+                                     'attendance' : self.set_random_attendance(),
+                                     'month_day'  : date.month * 100 + date.day}
                 
                 data.append(attendance_record)
 
         return data
+
+    def generate_chunks(self, chunk_size = 1000000):
+        '''
+        Yield DataFrames of randomized attendance records of roughly chunk_size rows each.
+
+        Considerations:
+            Each chunk covers a contiguous range of student_ids across every date, so the chunks arrive already ordered by student_id and date.
+            Attendance is drawn as one array per chunk with the same 80% rate as set_random_attendance.
+        '''
+        dates     = np.array(self.dates, dtype = 'datetime64[D]')
+        per_chunk = max(1, chunk_size // len(dates))
+
+        for first in range(1, self.max_student_id + 1, per_chunk):
+
+            student_ids = np.arange(first, min(first + per_chunk, self.max_student_id + 1))
+            yield pd.DataFrame({'date'       : np.tile(dates, len(student_ids)),
+                                'student_id' : np.repeat(student_ids, len(dates)),
+                                'attendance' : self.rng.random(len(student_ids) * len(dates)) < self.attendance_rate,
+                                'month_day'  : np.tile(get_month_day(dates), len(student_ids))})
     
+    def generate_matrix(self, chunk_size = 1000000):
+        '''
+        Generate attendance as a student × day AttendanceMatrix, packing each block of students' bits as soon as it is drawn.
+
+        Considerations:
+            The blocks and draws match generate_chunks, so expanding the matrix yields the same records for the same seed.
+        '''
+        dates     = np.array(self.dates, dtype = 'datetime64[D]')
+        per_chunk = max(1, chunk_size // len(dates))
+        blocks    = []
+
+        for first in range(1, self.max_student_id + 1, per_chunk):
+
+            students = min(per_chunk, self.max_student_id + 1 - first)
+            blocks.append(np.packbits(self.rng.random((students, len(dates))) < self.attendance_rate, axis = 1))
+
+        return AttendanceMatrix(np.concatenate(blocks), dates, np.arange(1, self.max_student_id + 1))
+
+    def generate_shard(self, dates, seed):
+        '''
+        Generate a DataFrame of attendance records for every student on the given dates, drawing attendance from a generator seeded for this shard.
+        '''
+        rng         = np.random.default_rng(seed)
+        student_ids = np.arange(1, self.max_student_id + 1)
+
+        return pd.DataFrame({'date'       : np.repeat(dates, len(student_ids)),
+                             'student_id' : np.tile(student_ids, len(dates)),
+                             'attendance' : rng.random(len(dates) * len(student_ids)) < self.attendance_rate,
+                             'month_day'  : np.repeat(get_month_day(dates), len(student_ids))})
+
+    def generate_parallel(self, workers = None, shard_size = 1000000):
+        '''
+        Generate attendance records in date-range shards of roughly shard_size rows, each with a seed spawned from self.seed.
+        '''
+        dates     = np.array(self.dates, dtype = 'datetime64[D]')
+        per_shard = max(1, shard_size // self.max_student_id)
+        shards    = [dates[start:start + per_shard] for start in range(0, len(dates), per_shard)]
+
+        return generate_shards(self.generate_shard, shards, self.seed, workers)
+
     def calculate_dates(self):
         '''
         Pre-calculating these dates allows for faster selection.
@@ -75,13 +160,43 @@ class SchoolAttendance:
         dates  = [self.start_date + timedelta(days = d) for d in range(delta.days + 1)]
         return dates
     
-    def __call__(self):
+    def __call__(self, workers = None, fmt = 'csv'):
         '''
         Generate a pandas DataFrame of attendance records for students within a specific date range.
+
+        Considerations:
+            Passing workers uses the sharded, seeded engine. workers = 1 runs the same shards in this process with identical output.
+            A seed also selects the sharded engine, running its shards in this process, so the same seed gives the same records
+            for any number of workers. Without either, the original row-by-row generate_data is used.
+            fmt can be 'csv', 'parquet', or 'feather', and the file can be reloaded with load_dataframe.
+            When the shared profiler is enabled, a summary of mutator and persistence costs is printed at the end.
         '''
-        df = to_dataframe(data      = self.generate_data(), 
-                          by        = ['student_id', 'date'], 
-                          filename  = save_path(True, 'Data', 'school_attendance.csv'),
-                          sql_table = 'school_attendance')
+        with profiler.step('SchoolAttendance.generate'):
+            data = self.generate_parallel(workers) if workers or self.seed is not None else self.generate_data()
+
+        df = to_dataframe(data        = data, 
+                          by          = ['student_id', 'date'], 
+                          filename    = save_path(True, 'Data', f'{self.sql_table}.{fmt}'),
+                          sql_table   = self.sql_table,
+                          sql_schema  = self.sql_schema,
+                          sql_indexes = self.sql_indexes,
+                          dtypes      = self.dtypes)
         
-        return df
\ No newline at end of file
+        profiler.report('SchoolAttendance')
+        return df
+
+    def stream(self, chunk_size = 1000000, matrix = None, pipelined = False):
+        '''
+        Write attendance records to CSV and SQLite one chunk at a time instead of building a single DataFrame.
+        Passing an AttendanceMatrix writes its expansion instead of drawing new records.
+        Passing pipelined = True writes the CSV and SQLite table in their own threads while the next chunks are generated.
+        Returns the number of rows written.
+        '''
+        chunks = matrix.generate_chunks(chunk_size) if matrix is not None else self.generate_chunks(chunk_size)
+
+        return write_chunks(chunks      = chunks,
+                            filename    = save_path(True, 'Data', f'{self.sql_table}.csv'),
+                            sql_table   = self.sql_table,
+                            sql_schema  = self.sql_schema,
+                            sql_indexes = self.sql_indexes,
+                            pipelined   = pipelined)
\ No newline at end of file
@@ -0,0 +1,73 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  ShippingCalendar
+
+This script precomputes the business-day calendar used to ship orders. It is built once per OrderHistory and covers
+every year between the first and last order date, plus the following year so late-December orders can ship into January.
+
+Attributes:
+    holidays (datetime64[D]): Every US federal holiday (observed dates included) in the covered years
+    days (datetime64[D]):     Every calendar day between start_date and end_date
+    lookup (datetime64[D]):   A days × max_offset table mapping each order date to its shipped date for each offset
+
+Considerations:
+    A shipped date is the order date plus 1 to max_offset calendar days, rolled forward to the next day that is neither a weekend nor a holiday.
+    Both the holiday set and the shipped-date table are built with NumPy once, so row-wise and columnar callers only perform lookups.
+    Order dates outside the calendar raise a ValueError, so the caller has to rebuild it for the wider range first.
+'''
+
+import numpy    as np
+import holidays as hd
+
+class ShippingCalendar:
+    def __init__(self, start_date, end_date, max_offset = 2):
+        self.start_date = start_date
+        self.end_date   = end_date
+        self.max_offset = max_offset
+
+        # Optimized variables for faster lookups
+        self.holidays    = self.set_holidays()
+        self.holiday_set = set(self.holidays.astype(object))
+        self.days        = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+        self.lookup      = self.set_lookup()
+
+    # Mutators
+    def set_holidays(self):
+        years = range(self.start_date.year, self.end_date.year + 2)
+        return np.array(sorted(hd.US(years = years)), dtype = 'datetime64[D]')
+
+    def set_lookup(self):
+        '''
+        Build the order date → shipped date table for every covered day and every offset in one np.busday_offset call.
+        '''
+        offsets = np.arange(1, self.max_offset + 1)
+        return np.busday_offset(self.days[:, None] + offsets, 0, roll = 'forward', holidays = self.holidays)
+
+    # Accessors
+    def get_index(self, order_dates):
+        '''
+        Return each order date's row in self.lookup, raising a ValueError for any date outside the calendar instead of
+        letting a negative index wrap around to the end of the table.
+        '''
+        index = (np.asarray(order_dates, dtype = 'datetime64[D]') - self.days[0]).astype(int)
+        if index.size and (index.min() < 0 or index.max() >= len(self.days)):
+            raise ValueError(f'Order dates must fall between {self.days[0]} and {self.days[-1]}, '
+                             f'but range from {self.days[0] + index.min()} to {self.days[0] + index.max()}')
+
+        return index
+
+    def get_shipped_dates(self, order_dates, offsets):
+        '''
+        Return the shipped dates for an array of order dates and an array of calendar-day offsets (1 to max_offset).
+        '''
+        return self.lookup[self.get_index(order_dates), np.asarray(offsets) - 1]
+
+    def get_shipped_date(self, order_date, offset):
+        return self.lookup[self.get_index(order_date), offset - 1].astype(object)
+
+    def get_holiday_flags(self, dates):
+        return np.isin(np.asarray(dates, dtype = 'datetime64[D]'), self.holidays)
+
+    def is_holiday(self, day):
+        return day in self.holiday_set
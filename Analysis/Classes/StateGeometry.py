@@ -0,0 +1,217 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  StateGeometry
+
+This script caches the state outlines from `Resources/Shapes/us_states.shp` already projected to the Lambert Conformal map used
+by the "Average Order Value by State" chart and simplified, so drawing the map never reparses or reprojects the shapefile.
+The cache is built once, stored as `Resources/Shapes/us_states.npz`, and loaded into memory as NumPy arrays.
+
+Layout:
+    states (U2):         The two-letter state code (STUSPS) of each state, as understood by get_state_name
+    names (U):           The full state name (NAME) of each state
+    state_offsets (int): Where each state's rings start in ring_offsets, with a trailing total
+    ring_offsets (int):  Where each ring (outline or island) starts in vertices, with a trailing total
+    vertices (float32):  The projected x, y of every ring vertex, in meters from the lower-left corner of the map
+    tolerance (float):   The Douglas–Peucker tolerance in meters the vertices were simplified with
+
+Usage:
+    geometry   = StateGeometry()
+    collection = geometry.draw(axes, state_aov, cmap = plot.cm.cividis, norm = norm)   # state_aov is indexed by state code
+    for month, values in monthly_aov.groupby('month'):
+        geometry.recolor(collection, values.set_index('state')['order_amount'])         # Only the face colors change
+        plot.savefig(f'aov_{month}.png')
+
+Considerations:
+    The projection matches the chart's Basemap(projection = 'lcc', lat_1 = 33, lat_2 = 45, lon_0 = -95) on its spherical earth, with
+    the lower-left corner at (-119°, 23°), so the vertices are in the same coordinates Basemap produced.
+    Rings whose simplified outline collapses to fewer than 3 distinct vertices (tiny islands) are dropped, except a state's first ring.
+    The cache is only rebuilt when it's missing, when a different tolerance is requested, or on request with rebuild = True or build()
+    after the shapefile changes. The shapefile's modification time isn't compared, since a git checkout sets it arbitrarily and
+    would otherwise rewrite the bundled cache just by drawing a map.
+    AK, HI, and PR fall outside the map's extent and are excluded by default.
+'''
+
+from .Utilities import *
+import numpy    as np
+import pandas   as pd
+
+class StateGeometry:
+    def __init__(self,
+                 filename        = save_path(True, 'Resources', 'Shapes', 'us_states.npz'),
+                 source          = save_path(True, 'Resources', 'Shapes', 'us_states.shp'),
+                 tolerance       = 2000,
+                 excluded_states = ('AK', 'HI', 'PR'),
+                 rebuild         = False):
+        self.filename        = filename
+        self.source          = source
+        self.tolerance       = tolerance
+        self.excluded_states = excluded_states
+
+        # The chart's Lambert Conformal parameters and map corners, in degrees, on Basemap's default spherical earth in meters
+        self.radius    = 6370997.0
+        self.parallels = (33, 45)
+        self.meridian  = -95
+        self.corners   = ((-119, 23), (-64, 49))
+
+        if rebuild or not self.is_current():
+            self.build()
+
+        geometry         = np.load(filename)
+        keep             = ~np.isin(geometry['states'], excluded_states)
+        self.states      = geometry['states'][keep]
+        self.names       = geometry['names'][keep]
+        self.polygons    = []
+        self.ring_states = []
+
+        offsets, vertices = geometry['ring_offsets'], geometry['vertices']
+        for i, (first, last) in enumerate(zip(geometry['state_offsets'][:-1][keep], geometry['state_offsets'][1:][keep])):
+
+            self.polygons    += [vertices[offsets[ring]:offsets[ring + 1]] for ring in range(first, last)]
+            self.ring_states += [i] * (last - first)
+
+        self.ring_states = np.array(self.ring_states)
+        self.extent      = self.get_projection(*np.array(self.corners, dtype = float).T)
+
+    # Accessors
+    def is_current(self):
+        '''
+        Check whether the cache exists and was simplified with this tolerance.
+        '''
+        if not os.path.exists(self.filename):
+            return False
+
+        return float(np.load(self.filename)['tolerance']) == self.tolerance
+
+    def get_projection(self, lons, lats):
+        '''
+        Project longitudes and latitudes in degrees to Lambert Conformal Conic x, y in meters, with the lower-left corner at (0, 0).
+
+        Considerations:
+            Uses the spherical form of the projection (Snyder, Map Projections: A Working Manual, eqs. 15-1 to 15-3 and 15-5),
+            where n is the cone constant and rho the distance from the cone's apex.
+        '''
+        phi_1, phi_2 = np.radians(self.parallels)
+        n            = np.log(np.cos(phi_1) / np.cos(phi_2)) / np.log(np.tan(np.pi / 4 + phi_2 / 2) / np.tan(np.pi / 4 + phi_1 / 2))
+        F            = np.cos(phi_1) * np.tan(np.pi / 4 + phi_1 / 2) ** n / n
+
+        def project(lons, lats):
+            rho   = self.radius * F / np.tan(np.pi / 4 + np.radians(lats) / 2) ** n
+            theta = n * np.radians(np.asarray(lons) - self.meridian)
+            return rho * np.sin(theta), -rho * np.cos(theta)
+
+        (x_0, y_0), _ = [project(lon, lat) for lon, lat in self.corners]
+        x, y          = project(lons, lats)
+
+        return np.column_stack([x - x_0, y - y_0])
+
+    def get_simplified(self, points):
+        '''
+        Simplify a ring with the Douglas–Peucker algorithm, keeping every vertex farther than self.tolerance from the simplified outline.
+
+        Considerations:
+            A closed ring's first and last points are the same, so it is first split at the vertex farthest from that point and
+            both halves are simplified separately. Each segment's vertices are measured against it in a single vectorized step.
+        '''
+        if len(points) < 4:
+            return points
+
+        keep     = np.zeros(len(points), dtype = bool)
+        split    = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        segments = [(0, split), (split, len(points) - 1)]
+
+        keep[[0, split, -1]] = True
+        while segments:
+
+            first, last = segments.pop()
+            if last - first < 2:
+                continue
+
+            (dx, dy), (mx, my) = points[last] - points[first], (points[first + 1:last] - points[first]).T
+            length             = np.hypot(dx, dy)
+            distances          = np.abs(dx * my - dy * mx) / length if length else np.hypot(mx, my)
+
+            farthest = int(np.argmax(distances))
+            if distances[farthest] > self.tolerance:
+                keep[first + 1 + farthest] = True
+                segments += [(first, first + 1 + farthest), (first + 1 + farthest, last)]
+
+        return points[keep]
+
+    def get_values(self, values, fill = 0):
+        '''
+        Return one value per ring from values indexed by state code (e.g. a groupby('state') result), for a PolyCollection's array.
+        States missing from values get fill, which is how the chart colored states without orders.
+        '''
+        by_state = pd.Series(values).reindex(self.states).fillna(fill).to_numpy(dtype = float)
+        return by_state[self.ring_states]
+
+    # Prescriptive Methods
+    def build(self):
+        '''
+        Read the shapefile, project and simplify every ring, and write the compact .npz layout described above.
+        '''
+        import shapefile
+
+        shapes = {}
+        with shapefile.Reader(self.source) as reader:
+            for shape_record in reader.iterShapeRecords():
+
+                shape, record = shape_record.shape, shape_record.record
+                points        = self.get_projection(*np.array(shape.points, dtype = float).T)
+                parts         = list(shape.parts) + [len(points)]
+                rings         = [self.get_simplified(points[first:last]) for first, last in zip(parts[:-1], parts[1:])]
+
+                shapes[record['STUSPS']] = (record['NAME'], [ring for i, ring in enumerate(rings) if len(ring) >= 4 or i == 0])
+
+        states = sorted(shapes)
+        rings  = [ring for state in states for ring in shapes[state][1]]
+
+        os.makedirs(os.path.dirname(self.filename) or '.', exist_ok = True)
+        np.savez_compressed(self.filename,
+                            states        = np.array(states, dtype = 'U2'),
+                            names         = np.array([shapes[state][0] for state in states]),
+                            state_offsets = np.cumsum([0] + [len(shapes[state][1]) for state in states]),
+                            ring_offsets  = np.cumsum([0] + [len(ring) for ring in rings]),
+                            vertices      = np.concatenate(rings).astype('float32'),
+                            tolerance     = float(self.tolerance))
+
+    def draw(self, ax, values = None, cmap = 'cividis', norm = None, edgecolor = '1', linewidth = 0.5):
+        '''
+        Add every state to ax as one PolyCollection colored by values, and fit ax to the map's extent.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to draw on, e.g. from load_plot.
+            values (pd.Series or dict, optional): The value to color each state by, keyed by state code. Defaults to uncolored outlines.
+            cmap (str or Colormap, optional): The colormap for values. Defaults to 'cividis'.
+            norm (Normalize, optional): Maps values to the colormap. Defaults to the range of values.
+            edgecolor, linewidth (optional): The state outline style.
+
+        Returns:
+            PolyCollection: The collection, which can be passed to recolor and to plt.colorbar as the mappable.
+        '''
+        from matplotlib.collections import PolyCollection
+
+        collection = PolyCollection(self.polygons, cmap = cmap, norm = norm, edgecolor = edgecolor, linewidth = linewidth,
+                                    facecolor = 'none' if values is None else None)
+        if values is not None:
+            self.recolor(collection, values)
+
+        ax.add_collection(collection)
+        ax.set_xlim(0, self.extent[1, 0])
+        ax.set_ylim(0, self.extent[1, 1])
+        ax.set_aspect('equal')
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+        return collection
+
+    def recolor(self, collection, values, fill = 0):
+        '''
+        Recolor a collection returned by draw with new values keyed by state code, without touching its geometry.
+        '''
+        collection.set_array(self.get_values(values, fill))
+        if collection.norm.vmin is None or collection.norm.vmax is None:
+            collection.autoscale_None()
+
+        return collection
@@ -13,11 +13,14 @@ Schema:
     gpa (integer):             The student's GPA
     date_of_birth (timestamp): The student's date of birth
     school_district (string):  The school district the student belongs to
+    month_day (integer):       The month and day of date_of_birth as month * 100 + day, for birthday joins
 
 Data Constraints:
     The cardinality is determined by student_id.
     The year in each date_of_birth should reasonably correspond to the grade_level each student is in.
     School_district and school_id have a fixed association, as do grade_level and the birth_year in date_of_birth.
+    The columnar engine draws every field for all students as a NumPy array from a single seeded generator, which is the default for __call__.
+    For very large student counts, stream() writes the profiles in student_id chunks, so memory stays bounded by the chunk size.
 '''
 
 from datetime   import date
@@ -26,8 +29,45 @@ import random   as rn
 import numpy    as np
 
 class Students:
-    def __init__(self, school_attendance):
+    def __init__(self, school_attendance, seed = None):
         self.school_attendance = school_attendance
+        self.seed              = seed
+        self.rng               = np.random.default_rng(seed)
+
+        # Declared SQLite table, schema, and the indexes built after each load
+        self.sql_table   = 'students'
+        self.sql_schema  = {'student_id'      : 'INTEGER PRIMARY KEY',
+                            'school_id'       : 'TEXT',
+                            'grade_level'     : 'INTEGER',
+                            'gpa'             : 'REAL',
+                            'date_of_birth'   : 'DATE',
+                            'school_district' : 'TEXT',
+                            'month_day'       : 'INTEGER'}
+        self.sql_indexes = [('school_id', 'grade_level'), 'date_of_birth']
+
+        # Compact in-memory dtypes applied by to_dataframe
+        self.dtypes = {'student_id'      : 'int32',
+                       'school_id'       : 'category',
+                       'grade_level'     : 'int8',
+                       'date_of_birth'   : 'datetime64[s]',
+                       'school_district' : 'category',
+                       'month_day'       : 'int16'}
+
+        # Optimized variables for faster mutator performance
+        self.school_district_mapping = {'SC1' : 'District 1',
+                                        'SC2' : 'District 1',
+                                        'SC3' : 'District 2',
+                                        'SC4' : 'District 2',
+                                        'SC5' : 'District 3',
+                                        'SC6' : 'District 3'}
+        self.birth_months            = [3] * 12 + [i for i in range(1, 13)] * 5
+        self.current_year            = date.today().year
+
+        # Array equivalents of the variables above for the columnar engine, indexed by position or by month
+        self.school_array                       = np.array(list(self.school_district_mapping.keys()))
+        self.district_array, self.district_codes = np.unique(list(self.school_district_mapping.values()), return_inverse = True)
+        self.month_array                         = np.array(self.birth_months)
+        self.month_lengths                       = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
 
     # Mutators
     def set_student_ids(self):
@@ -47,16 +87,7 @@ class Students:
             school_district_mapping ensures a fixed association between school_id and school_district.
         '''
         school_id = f'SC{rn.randint(1, 6)}'
-        school_district_mapping = {
-            'SC1' : 'District 1',
-            'SC2' : 'District 1',
-            'SC3' : 'District 2',
-            'SC4' : 'District 2',
-            'SC5' : 'District 3',
-            'SC6' : 'District 3',
-        }
-        school_district = school_district_mapping[school_id]
-        return school_id, school_district
+        return school_id, self.school_district_mapping[school_id]
 
     def set_grade_level(self):
         return rn.randint(1, 12)
@@ -68,55 +99,145 @@ class Students:
         Considerations:
             Uses a normal distribution to make values most likely to occur in the 3 to 3.2 range.
         '''
-        gpa = round(np.clip(rn.normalvariate(3, 0.2), 1, 4), 2)
-
-        return gpa
+        return round(min(max(rn.normalvariate(3, 0.2), 1), 4), 2)
 
     def set_date_of_birth(self, grade_level):
         # Adjust the year based on grade level
-        birth_year  = date.today().year - (grade_level + 5)
-        birth_month = rn.choice([3] * 12 + [i for i in range(1, 13)] * 5)
-        birth_day   = rn.randint(1, 28 if birth_month == 2 else 30 \
-                                       if birth_month in {4, 6, 9, 11} else 31)
+        birth_year  = self.current_year - (grade_level + 5)
+        birth_month = rn.choice(self.birth_months)
+        birth_day   = rn.randint(1, self.month_lengths[birth_month])
 
         return date(birth_year, birth_month, birth_day)
 
+    # Columnar Mutators
+    def set_grade_levels(self, n):
+        return self.rng.integers(1, 13, n)
+
+    def set_school_ids_and_districts(self, n):
+        '''
+        Array version of set_school_id_and_district. Each student draws one school position, which indexes both the school and its district.
+
+        Considerations:
+            Both are returned as categoricals built from the positions, which is the dtype to_dataframe stores them in anyway,
+            so no per-student strings are created.
+        '''
+        schools = self.rng.integers(0, len(self.school_array), n)
+        return (pd.Categorical.from_codes(schools,                      self.school_array),
+                pd.Categorical.from_codes(self.district_codes[schools], self.district_array))
+
+    def set_gpas(self, n):
+        return np.round(np.clip(self.rng.normal(3, 0.2, n), 1, 4), 2)
+
+    def set_dates_of_birth(self, grade_levels):
+        '''
+        Array version of set_date_of_birth, returning the dates as datetime64[D] along with their month_day keys.
+
+        Considerations:
+            Each date is built as the first of its year and month, plus a day offset drawn below that month's length (February is always 28).
+        '''
+        n            = len(grade_levels)
+        birth_years  = self.current_year - (grade_levels + 5)
+        birth_months = self.rng.choice(self.month_array, n)
+        birth_days   = self.rng.integers(1, self.month_lengths[birth_months] + 1)
+
+        months = ((birth_years - 1970) * 12 + birth_months - 1).astype('datetime64[M]')
+        return months.astype('datetime64[D]') + (birth_days - 1), (birth_months * 100 + birth_days).astype('int16')
+
     # Prescriptive Methods
-    def generate_data(self):
+    def generate_data(self, student_ids = None):
         '''
         Generate a list of dictionaries with randomized student data to be output as either a CSV file or a pandas DataFrame for immediate use.
         
         Considerations:
             A dictionary is used for each student record because it allows for easy conversion to a pandas DataFrame later.
             The arguments grade_level, school_id, and school_district are defined before student_record to maintain a logical flow of data generation.
+            Passing student_ids limits the records to that subset, which is how generate_chunks splits the work.
         '''
         data = []
-        for student_id in self.set_student_ids():
+        for student_id in self.set_student_ids() if student_ids is None else student_ids:
 
             grade_level         = self.set_grade_level()
             school_id, district = self.set_school_id_and_district()
+            date_of_birth       = self.set_date_of_birth(grade_level)
             student_record      = {'student_id'      : student_id,
                                    'school_id'       : school_id,
                                    'grade_level'     : grade_level,
                                    'gpa'             : self.set_gpa(),
-                                   'date_of_birth'   : self.set_date_of_birth(grade_level),
-                                   'school_district' : district}
+                                   'date_of_birth'   : date_of_birth,
+                                   'school_district' : district,
+                                   'month_day'       : date_of_birth.month * 100 + date_of_birth.day}
             
             data.append(student_record)
 
         return data
+
+    def generate_columns(self, student_ids = None):
+        '''
+        Generate a dictionary of NumPy arrays with randomized student data, using the same schema and distributions as generate_data.
+
+        Considerations:
+            Each column is drawn in one vectorized call from self.rng, so a fixed seed reproduces the same dataset.
+            Passing student_ids limits the records to that subset, which is how generate_chunks splits the work.
+        '''
+        if student_ids is None:
+            student_ids = self.set_student_ids()
+
+        n                         = len(student_ids)
+        grade_levels              = self.set_grade_levels(n)
+        school_ids, districts     = self.set_school_ids_and_districts(n)
+        dates_of_birth, month_day = self.set_dates_of_birth(grade_levels)
+
+        return {'student_id'      : np.asarray(student_ids),
+                'school_id'       : school_ids,
+                'grade_level'     : grade_levels,
+                'gpa'             : self.set_gpas(n),
+                'date_of_birth'   : dates_of_birth,
+                'school_district' : districts,
+                'month_day'       : month_day}
+
+    def generate_chunks(self, chunk_size = 1000000):
+        '''
+        Yield DataFrames of randomized student profiles for consecutive ranges of chunk_size student_ids, so the chunks arrive in key order.
+        '''
+        student_ids = self.set_student_ids()
+        for start in range(0, len(student_ids), chunk_size):
+            yield pd.DataFrame(self.generate_columns(student_ids[start:start + chunk_size]))
     
-    def __call__(self):
+    def __call__(self, columnar = True, fmt = 'csv'):
         '''
         Generate a pandas DataFrame of randomized student profiles.
 
         Considerations:
             The id field is not requires, since the table's cardinality is already fully determined by student_id
+            The columnar engine is used by default. Passing columnar = False falls back to the original row-by-row generate_data.
+            fmt can be 'csv', 'parquet', or 'feather', and the file can be reloaded with load_dataframe.
+            When the shared profiler is enabled, a summary of mutator and persistence costs is printed at the end.
         '''
-        df = to_dataframe(data      = self.generate_data(), 
-                          by        = ['student_id'],
-                          add_id    = False,
-                          filename  = save_path(True, 'Data', 'students.csv'),
-                          sql_table = 'students')
+        with profiler.step('Students.generate'):
+            data = self.generate_columns() if columnar else self.generate_data()
+
+        df = to_dataframe(data        = data, 
+                          by          = ['student_id'],
+                          add_id      = False,
+                          filename    = save_path(True, 'Data', f'{self.sql_table}.{fmt}'),
+                          sql_table   = self.sql_table,
+                          sql_schema  = self.sql_schema,
+                          sql_indexes = self.sql_indexes,
+                          dtypes      = self.dtypes)
         
-        return df
\ No newline at end of file
+        profiler.report('Students')
+        return df
+
+    def stream(self, chunk_size = 1000000, pipelined = False):
+        '''
+        Write student profiles to CSV and SQLite one chunk at a time instead of building a single DataFrame.
+        Passing pipelined = True writes the CSV and SQLite table in their own threads while the next chunks are generated.
+        Returns the number of rows written.
+        '''
+        return write_chunks(chunks      = self.generate_chunks(chunk_size),
+                            add_id      = False,
+                            filename    = save_path(True, 'Data', f'{self.sql_table}.csv'),
+                            sql_table   = self.sql_table,
+                            sql_schema  = self.sql_schema,
+                            sql_indexes = self.sql_indexes,
+                            pipelined   = pipelined)
\ No newline at end of file
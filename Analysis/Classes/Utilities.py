@@ -9,23 +9,45 @@ It is meant to be used by other classes or scripts that require similar function
 
 Functions:
     save_path: Constructs a file path based on the provided subdirectories and an optional parent directory inclusion
-    to_dataframe: Converts the generated data to a pandas DataFrame, sorts it, and optionally saves it to a SQLite database table and/or a CSV file
+    get_loader: Returns the shared SQLiteLoader (and connection) for a database file, creating it on first use
+    to_dataframe: Converts the generated data to a pandas DataFrame, sorts it, and optionally saves it to a SQLite database table and/or a CSV, Parquet, or Arrow file
+    optimize_dtypes: Casts a DataFrame to a compact dtype plan and records its memory footprint before and after
+    save_dataframe: Saves a DataFrame as CSV, Parquet, or Arrow IPC (Feather) based on the file extension
+    load_dataframe: Loads a saved DataFrame, memory-mapping Arrow IPC and Parquet files instead of parsing them
+    external_sort: Sorts a stream of DataFrame chunks that doesn't fit in memory by spilling sorted runs to disk and merging them
+    write_chunks: Appends a stream of DataFrame chunks to a CSV file and/or a SQLite database table as each chunk arrives, optionally pipelined
+    generate_shards: Generates independent shards with seeds spawned from one SeedSequence, optionally across a process pool
+    get_month_day: Converts dates to an integer month-day key (e.g. March 14 → 314) that can be indexed and compared across years
     load_sql: Loads the ipython-sql extension and establishes a connection to a SQLite database
     load_plot: Applies a custom dark style and common customizations to a pyplot visualization and returns the pyplot, Axes, and color palette objects
     polynomial_regression: Performs polynomial regression and returns the forecast dates and forecasted values
+    polynomial_regressions: Fits a polynomial Ridge regression for every group in a long DataFrame at once and returns all of their forecasts
     get_state_name: Converts a two-letter state code to its full state name using the state_dict dictionary
+
+Objects:
+    profiler: The shared Profiler. Once enabled, it records the to_dataframe steps and any generator mutators it was given
+    plt, seaborn: LazyModule proxies for matplotlib.pyplot and seaborn, imported the first time a plot is drawn
+
+Considerations:
+    IPython, matplotlib, and seaborn are only imported by load_sql and load_plot, so scripts that only generate data
+    (e.g. `python -m Classes order_history`) start without loading a display stack.
 '''
 
-from IPython               import get_ipython
-from sklearn.linear_model  import Ridge
-from sklearn.preprocessing import PolynomialFeatures
+from concurrent.futures    import ProcessPoolExecutor
+from .ChunkPipeline        import ChunkPipeline
+from .LazyModule           import LazyModule
+from .Profiler             import Profiler
+from .SQLiteLoader         import SQLiteLoader
 
-import matplotlib.pyplot as plt
 import numpy             as np
 import pandas            as pd
 import os
-import sqlite3
-import seaborn
+import pickle
+import tempfile
+
+# Plotting dependencies, imported on first use
+plt     = LazyModule('matplotlib.pyplot')
+seaborn = LazyModule('seaborn')
 
 def save_path(use_parent_directory, 
               *subdirs):
@@ -48,12 +70,32 @@ def save_path(use_parent_directory,
     return path
 
 
+# One loader per database file, so every table written in a session shares a connection
+_loaders = {}
+
+# Opt-in instrumentation for the generators and to_dataframe. Disabled until profiler.enable() is called
+profiler = Profiler()
+
+def get_loader(filename = None):
+    '''
+    Return the SQLiteLoader for the given database file, defaulting to `jane.db`. The loader is created once and then reused.
+    '''
+    filename = filename or save_path(True, 'Data', 'jane.db')
+    if filename not in _loaders:
+        _loaders[filename] = SQLiteLoader(filename)
+
+    return _loaders[filename]
+
+
 def to_dataframe(data, 
-                 by        = None, 
-                 ascending = True,
-                 add_id    = True, 
-                 filename  = None,
-                 sql_table = None):
+                 by          = None, 
+                 ascending   = True,
+                 add_id      = True, 
+                 filename    = None,
+                 sql_table   = None,
+                 sql_schema  = None,
+                 sql_indexes = None,
+                 dtypes      = None):
     '''
     Return a pandas DataFrame representation of the data dictionary object.
     Optionally save the DataFrame to a CSV file if the filename is provided.
@@ -62,8 +104,11 @@ def to_dataframe(data,
         data (dict): The data to be converted to a DataFrame.
         by (str or list of str, optional): Column(s) to sort the DataFrame by.
         ascending (bool, optional): Sort order for the specified columns. Defaults to True.
-        filename (str, optional): Name of the CSV file to save the DataFrame to.
+        filename (str, optional): Name of the CSV, Parquet, or Arrow IPC file to save the DataFrame to. The format follows the extension.
         sql_table (str, optional): Name of the SQL table to save the DataFrame to.
+        sql_schema (dict, optional): Column → SQL type declarations for sql_table. Undeclared columns are inferred from the dtypes.
+        sql_indexes (list, optional): Columns or tuples of columns to index in sql_table after it is loaded.
+        dtypes (dict, optional): Column → dtype plan applied before sorting. See optimize_dtypes.
 
     Returns:
         pd.DataFrame: The sorted DataFrame with an id column added.
@@ -71,33 +116,420 @@ def to_dataframe(data,
     Considerations:
         An id column is added with monotonically increasing integers starting from 1 to facilitate record identification and improve query performance.
         If ascending is skipped, the function will apply the default True to all columns in the by argument
+        Casting to the dtype plan first means the sort, the writes, and every later groupby work on the compact columns.
+        Each step is timed by the shared profiler while it is enabled.
     '''
-    df = pd.DataFrame(data)
+    with profiler.step('to_dataframe.build'):
+        df = pd.DataFrame(data)
+
+    if dtypes:
+        with profiler.step('to_dataframe.optimize_dtypes'):
+            df = optimize_dtypes(df, dtypes)
+
     if by:
-        df = df.sort_values(by        = by, 
-                            ascending = ascending)
+        with profiler.step('to_dataframe.sort'):
+            df = df.sort_values(by        = by, 
+                                ascending = ascending)
 
     if add_id:
         df.insert(0, 'id', range(1, len(df) + 1))
 
     if filename:
-        df.to_csv(filename, index = False)
+        with profiler.step('to_dataframe.save_dataframe'):
+            save_dataframe(df, filename)
 
     if sql_table:
-        df.to_sql(sql_table, 
-                  sqlite3.connect(save_path(True, 'Data', 'jane.db')),
-                  if_exists = 'replace', 
-                  index     = False)
+        with profiler.step('to_dataframe.sqlite'):
+            get_loader().load(sql_table, df, sql_schema, sql_indexes or ())
         
     return df
 
 
+def optimize_dtypes(df, 
+                    dtypes):
+    '''
+    Cast a DataFrame's columns to a compact dtype plan and record the memory footprint before and after.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to cast.
+        dtypes (dict): Column → dtype, e.g. 'datetime64[s]' for dates, 'category' for low-cardinality strings, or 'int8' for small integers.
+
+    Returns:
+        pd.DataFrame: The cast DataFrame, with df.attrs['memory_usage'] holding the 'before' and 'after' sizes in bytes.
+
+    Considerations:
+        Sizes are measured with deep=True, so Python string and date objects are counted at their real cost.
+        pandas has no day-resolution datetime dtype, so 'datetime64[s]' is the most compact date representation available.
+    '''
+    before = df.memory_usage(deep = True).sum()
+    df     = df.astype({column: dtype for column, dtype in dtypes.items() if column in df.columns})
+    after  = df.memory_usage(deep = True).sum()
+
+    df.attrs['memory_usage'] = {'before' : int(before), 
+                                'after'  : int(after)}
+    return df
+
+
+def save_dataframe(df, 
+                   filename,
+                   max_dictionary_ratio = 0.5):
+    '''
+    Save a DataFrame to filename, choosing the format from the extension.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to save.
+        filename (str): A .csv, .parquet, .feather, or .arrow path.
+        max_dictionary_ratio (float, optional): String columns with at most this ratio of distinct values to rows are dictionary-encoded. Defaults to 0.5.
+
+    Considerations:
+        Arrow IPC (.feather/.arrow) files are written uncompressed, so load_dataframe can memory-map them without copying.
+        Parquet files are zstd-compressed and are the smaller choice when load time matters less than disk space.
+        Low-cardinality strings such as status, school_district, and state are stored once per distinct value, with integer codes per row.
+    '''
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        df.to_csv(filename, index = False)
+        return
+
+    import pyarrow         as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index = False)
+    for i, field in enumerate(table.schema):
+
+        column = table.column(i)
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            if pc.count_distinct(column).as_py() <= max_dictionary_ratio * len(column):
+                table = table.set_column(i, field.name, column.dictionary_encode())
+
+    if extension == '.parquet':
+        pq.write_table(table, filename, compression = 'zstd')
+    elif extension in ('.feather', '.arrow'):
+        feather.write_feather(table, filename, compression = 'uncompressed')
+    else:
+        raise ValueError(f'Unsupported file format: {extension}')
+
+
+def load_dataframe(filename, 
+                   memory_map = True):
+    '''
+    Load a DataFrame previously written by save_dataframe, choosing the format from the extension.
+
+    Args:
+        filename (str): A .csv, .parquet, .feather, or .arrow path.
+        memory_map (bool, optional): Memory-map Arrow IPC and Parquet files instead of reading them into memory. Defaults to True.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame.
+
+    Considerations:
+        Arrow columns are wrapped in pd.ArrowDtype rather than converted, so an uncompressed Arrow IPC file loads without copying its data.
+        Dictionary-encoded columns come back as pandas categoricals.
+    '''
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == '.csv':
+        return pd.read_csv(filename)
+
+    import pyarrow         as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if extension == '.parquet':
+        table = pq.read_table(filename, memory_map = memory_map)
+    elif extension in ('.feather', '.arrow'):
+        table = feather.read_table(filename, memory_map = memory_map)
+    else:
+        raise ValueError(f'Unsupported file format: {extension}')
+
+    return table.to_pandas(types_mapper = lambda arrow_type: None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type))
+
+
+def external_sort(chunks, 
+                  by, 
+                  ascending  = True,
+                  chunk_size = 1000000):
+    '''
+    Sort a stream of DataFrame chunks by the given columns without holding the whole dataset in memory.
+
+    Args:
+        chunks (iterable of pd.DataFrame): The unsorted chunks, all with the same columns.
+        by (str or list of str): Column(s) to sort by.
+        ascending (bool, optional): Sort order for every column in by. Defaults to True.
+        chunk_size (int, optional): The number of rows in each output chunk and in each block read back from disk. Defaults to 1,000,000.
+
+    Yields:
+        pd.DataFrame: Globally sorted chunks of up to chunk_size rows.
+
+    Considerations:
+        Each incoming chunk is sorted and spilled to a temporary file as a sequence of pickled blocks, so column types survive the round trip.
+        The runs are merged a block at a time, keeping one block per run in memory. Each round takes every row that sorts at or before
+        the earliest block tail, since no run can produce an earlier row after it, and sorts that batch with one vectorized sort_values.
+        Every round finishes at least one block, so the merge costs a few pandas calls per block rather than Python work per row.
+    '''
+    by = [by] if isinstance(by, str) else list(by)
+
+    with tempfile.TemporaryDirectory() as directory:
+        
+        runs = []
+        for i, chunk in enumerate(chunks):
+
+            run = os.path.join(directory, f'run_{i}.pkl')
+            with open(run, 'wb') as file:
+
+                chunk = chunk.sort_values(by = by, ascending = ascending)
+                for start in range(0, len(chunk), chunk_size):
+                    pickle.dump(chunk.iloc[start:start + chunk_size], file)
+
+            runs.append(run)
+            columns = list(chunk.columns)
+
+        if not runs:
+            return
+
+        def read_run(run):
+            with open(run, 'rb') as file:
+                while True:
+                    try:
+                        yield pickle.load(file)
+                    except EOFError:
+                        return
+
+        readers = [read_run(run) for run in runs]
+        blocks  = [next(reader, None) for reader in readers]
+        readers = [reader for reader, block in zip(readers, blocks) if block is not None]
+        blocks  = [block for block in blocks if block is not None]
+        pending = blocks[0].iloc[:0] if blocks else None
+
+        while readers:
+
+            # Every run's later rows sort after its current block's tail, so rows up to the first tail are final
+            tails  = [tuple(block[column].iloc[-1] for column in by) for block in blocks]
+            cutoff = min(tails) if ascending else max(tails)
+            counts = [_count_through(block, by, cutoff, ascending) for block in blocks]
+
+            # The rows still pending all sort before this batch, so only the batch itself needs sorting
+            batch   = pd.concat([block.iloc[:count] for block, count in zip(blocks, counts)], ignore_index = True)
+            pending = pd.concat([pending, batch.sort_values(by = by, ascending = ascending, kind = 'stable')], ignore_index = True)
+            while len(pending) >= chunk_size:
+                yield pending.iloc[:chunk_size].reset_index(drop = True)
+                pending = pending.iloc[chunk_size:]
+
+            # Consumed blocks are replaced by the run's next block, and finished runs are dropped
+            for i in reversed(range(len(blocks))):
+                blocks[i] = blocks[i].iloc[counts[i]:]
+                if blocks[i].empty:
+                    blocks[i] = next(readers[i], None)
+                    if blocks[i] is None:
+                        del blocks[i], readers[i]
+
+        if pending is not None and len(pending):
+            yield pending.reset_index(drop = True)
+
+
+def _count_through(block, by, cutoff, ascending):
+    '''
+    Return the number of leading rows of the sorted block whose by columns sort at or before the cutoff tuple.
+    '''
+    before = np.zeros(len(block), dtype = bool)
+    equal  = np.ones(len(block), dtype = bool)
+    for column, value in zip(by, cutoff):
+
+        values  = block[column].to_numpy()
+        before |= equal & ((values < value) if ascending else (values > value))
+        equal  &= values == value
+
+    return int((before | equal).sum())
+
+
+def write_chunks(chunks, 
+                 by          = None, 
+                 ascending   = True,
+                 add_id      = True, 
+                 filename    = None,
+                 sql_table   = None,
+                 sql_schema  = None,
+                 sql_indexes = None,
+                 chunk_size  = 1000000,
+                 append      = False,
+                 pipelined   = False,
+                 queue_size  = 2):
+    '''
+    Stream DataFrame chunks to a CSV file and/or a SQLite database table, appending each chunk as it arrives.
+    This is the streaming counterpart of to_dataframe, for datasets that are too large to build as a single DataFrame.
+
+    Args:
+        chunks (iterable of pd.DataFrame): The chunks to be written, all with the same columns.
+        by (str or list of str, optional): Column(s) to sort by. Only needed when the chunks aren't already generated in key order.
+        ascending (bool, optional): Sort order for the specified columns. Defaults to True.
+        add_id (bool, optional): Whether to add a running id column across all chunks. Defaults to True.
+        filename (str, optional): Name of the CSV file to save the chunks to.
+        sql_table (str, optional): Name of the SQL table to save the chunks to.
+        sql_schema (dict, optional): Column → SQL type declarations for sql_table. Undeclared columns are inferred from the first chunk.
+        sql_indexes (list, optional): Columns or tuples of columns to index in sql_table once every chunk is loaded.
+        chunk_size (int, optional): The number of rows per chunk when the chunks have to be externally sorted. Defaults to 1,000,000.
+        append (bool, optional): Append to an existing CSV file and SQL table instead of replacing them. Defaults to False.
+        pipelined (bool, optional): Write the CSV file and load the SQL table in their own threads while the next chunks are generated.
+        queue_size (int, optional): With pipelined, the number of chunks each writer can fall behind before generation waits. Defaults to 2.
+
+    Returns:
+        int: The total number of rows written.
+
+    Considerations:
+        Peak memory is bounded by the chunk size, since no chunk is kept after it has been written.
+        The first chunk replaces any existing CSV file or SQL table, and the rest are appended to it.
+        Indexes are only built after the last chunk, so the inserts never have to maintain them.
+        With append, existing rows are never rewritten, and the existing table's indexes are maintained by the inserts instead.
+        Pipelined writes go through a ChunkPipeline, so the wall time approaches that of the slowest of generating, writing the CSV,
+        and loading SQLite, instead of their sum. The SQL table is loaded over its own connection to the same database file.
+        Each stage's busy time is recorded by the shared profiler while it is enabled.
+    '''
+    if by:
+        chunks = external_sort(chunks, by, ascending, chunk_size)
+
+    loader     = get_loader()
+    rows       = 0
+    csv_exists = append and filename is not None and os.path.exists(filename)
+    sql_exists = append and sql_table is not None and loader.has_table(sql_table)
+
+    if pipelined:
+        sinks = {}
+        if filename:
+            sinks['csv']    = lambda chunks: _write_csv_chunks(chunks, filename, csv_exists)
+        if sql_table:
+            sinks['sqlite'] = lambda chunks: _load_sql_chunks(chunks, loader.filename, sql_table, sql_schema, sql_indexes, sql_exists)
+
+        pipeline = ChunkPipeline(sinks, queue_size)
+        rows     = pipeline(_add_chunk_ids(chunks) if add_id else chunks)
+        if profiler.enabled:
+            for name, seconds in pipeline.stats.items():
+                profiler.record(f'write_chunks.{name}', seconds)
+
+        return rows
+
+    with loader.bulk():
+        for chunk in chunks:
+
+            if add_id:
+                chunk.insert(0, 'id', range(rows + 1, rows + len(chunk) + 1))
+
+            if filename:
+                chunk.to_csv(filename, 
+                             index  = False, 
+                             mode   = 'a' if rows or csv_exists else 'w', 
+                             header = not (rows or csv_exists))
+
+            if sql_table:
+                if not (rows or sql_exists):
+                    loader.create(sql_table, chunk, sql_schema)
+                loader.insert(sql_table, chunk)
+
+            rows += len(chunk)
+
+        if sql_table and rows and not sql_exists:
+            loader.index(sql_table, sql_indexes or ())
+
+    return rows
+
+
+# The stages of a pipelined write_chunks. Each sink runs in its own thread and consumes the chunks to the end
+def _add_chunk_ids(chunks):
+    rows = 0
+    for chunk in chunks:
+
+        chunk.insert(0, 'id', range(rows + 1, rows + len(chunk) + 1))
+        rows += len(chunk)
+        yield chunk
+
+def _write_csv_chunks(chunks, filename, exists):
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(filename, 
+                     index  = False, 
+                     mode   = 'a' if i or exists else 'w', 
+                     header = not (i or exists))
+
+def _load_sql_chunks(chunks, filename, sql_table, sql_schema, sql_indexes, exists):
+    '''
+    Load the chunks over a new connection, since a sqlite3 connection can only be used by the thread that opened it.
+    '''
+    loader = SQLiteLoader(filename)
+    rows   = 0
+    try:
+        with loader.bulk():
+            for chunk in chunks:
+
+                if not (rows or exists):
+                    loader.create(sql_table, chunk, sql_schema)
+                loader.insert(sql_table, chunk)
+                rows += len(chunk)
+
+            if rows and not exists:
+                loader.index(sql_table, sql_indexes or ())
+    finally:
+        loader.close()
+
+
+def generate_shards(generate_shard, 
+                    shards, 
+                    seed    = None, 
+                    workers = None):
+    '''
+    Generate every shard with its own child seed and concatenate the results in shard order.
+
+    Args:
+        generate_shard (callable): A function or bound method taking (shard, seed) and returning a pandas DataFrame.
+        shards (list): The independent units of work, e.g. date ranges, order counts, or customer id ranges.
+        seed (int, optional): The root seed. Each shard gets the child seed at its position from SeedSequence(seed).spawn.
+        workers (int, optional): The number of processes to run the shards across. Defaults to running them in this process.
+
+    Returns:
+        pd.DataFrame: The concatenated shards.
+
+    Considerations:
+        Each shard's seed depends only on the root seed and the shard's position, never on which process runs it.
+        The same seed therefore produces identical output for any number of workers, including a single-process run.
+    '''
+    seeds = np.random.SeedSequence(seed).spawn(len(shards))
+
+    if workers and workers > 1:
+        with ProcessPoolExecutor(workers, initializer = _set_shard_generator, initargs = (generate_shard,)) as executor:
+            frames = list(executor.map(_generate_shard, shards, seeds))
+    else:
+        frames = list(map(generate_shard, shards, seeds))
+
+    return pd.concat(frames, ignore_index = True)
+
+
+# The generator is sent to each worker process once, rather than pickled again for every shard
+_shard_generator = None
+
+def _set_shard_generator(generate_shard):
+    global _shard_generator
+    _shard_generator = generate_shard
+
+def _generate_shard(shard, seed):
+    return _shard_generator(shard, seed)
+
+
+def get_month_day(dates):
+    '''
+    Return month * 100 + day for an array of dates as int16, without formatting any strings.
+    '''
+    days   = np.asarray(dates, dtype = 'datetime64[D]')
+    months = days.astype('datetime64[M]')
+
+    return ((months.astype(int) % 12 + 1) * 100 + (days - months).astype(int) + 1).astype('int16')
+
+
 def load_sql():
     '''
     Load the ipython-sql extension and establish a connection to the SQLite database.
     
     This function is designed to be used in Jupyter Notebooks. It loads the ipython-sql extension and connects to the SQLite database using the provided file path.
     '''
+    from IPython import get_ipython
+
     ipy = get_ipython()
     
     # Check if the 'sql' extension is already loaded
@@ -164,14 +596,88 @@ def polynomial_regression(x,
     Considerations:
         The default values for degree, days_to_predict, and alpha are set according to the specific problem being solved.
         Adjusting these values may be necessary depending on the nature of the data and the desired level of model complexity.
+        This is the single-series case of polynomial_regressions.
     """
-    origin   = pd.Timestamp(x.min())
-    x_series = (pd.Series(x).apply(pd.Timestamp) - origin).dt.days.values.reshape(-1, 1)
-    features = PolynomialFeatures(degree)
-    dates    = np.arange(x_series.max() + 1, x_series.max() + 1 + days).reshape(-1, 1)
-    
-    return origin + pd.to_timedelta(dates.flatten(), unit = 'D'), \
-           Ridge(alpha).fit(features.fit_transform(x_series), y.values).predict(features.transform(dates))
+    forecast = polynomial_regressions(pd.DataFrame({'group' : 0,
+                                                    'x'     : np.asarray(x),
+                                                    'y'     : np.asarray(y, dtype = float)}),
+                                      by     = 'group',
+                                      x      = 'x',
+                                      y      = 'y',
+                                      degree = degree,
+                                      days   = days,
+                                      alpha  = alpha)
+
+    return pd.DatetimeIndex(forecast['x']), forecast['y'].to_numpy()
+
+
+def polynomial_regressions(df, 
+                           by, 
+                           x, 
+                           y, 
+                           degree = 2, 
+                           days   = 20, 
+                           alpha  = 500):
+    """
+    Fit a polynomial Ridge regression of y on the dates in x for every group in df, and forecast each group the given number of days ahead.
+
+    Args:
+        df (pd.DataFrame):       A long DataFrame with one row per observation.
+        by (str or list):        The column(s) identifying each series, e.g. 'store_id' or ['state', 'store_id'].
+        x (str):                 The date column.
+        y (str):                 The value column.
+        degree (int, optional):  The degree of the polynomial. Defaults to 2.
+        days(int, optional):     The number of days to predict. Defaults to 20.
+        alpha (float, optional): The regularization strength. Defaults to 500.
+
+    Returns:
+        pd.DataFrame: The by column(s), the forecast date in x, and the forecasted value in y, with days rows per group.
+
+    Considerations:
+        Each group is measured in days from its own first date, exactly as a separate PolynomialFeatures + Ridge fit would be.
+        Ridge leaves the intercept unpenalized, so the features and y are centered on their group means and the intercept is recovered afterwards.
+        Every group's normal equations are accumulated with np.bincount over the group codes and solved together as one stacked
+        degree × degree system, so there is no Python loop over groups and no row-wise timestamp parsing.
+    """
+    groups = df.groupby(by, sort = True, observed = True)
+    codes  = groups.ngroup().to_numpy()
+    labels = groups.size().index
+    n      = len(labels)
+    sums   = lambda weights: np.bincount(codes, weights, minlength = n)
+
+    # Days since each group's first date
+    stamps  = df[x].to_numpy().astype('datetime64[D]').astype('int64')
+    origins = pd.Series(stamps).groupby(codes).min().to_numpy()
+    offsets = stamps - origins[codes]
+    lasts   = pd.Series(offsets).groupby(codes).max().to_numpy()
+
+    # Centered polynomial features and values
+    counts   = sums(None)
+    powers   = offsets[:, None].astype(float) ** np.arange(1, degree + 1)
+    means    = np.stack([sums(powers[:, i]) for i in range(degree)], axis = 1) / counts[:, None]
+    values   = df[y].to_numpy().astype(float)
+    y_means  = sums(values) / counts
+    centered = powers - means[codes]
+    residual = values - y_means[codes]
+
+    # One (degree × degree) ridge system per group, solved together
+    gram = np.empty((n, degree, degree))
+    for i in range(degree):
+        for j in range(i, degree):
+            gram[:, i, j] = gram[:, j, i] = sums(centered[:, i] * centered[:, j])
+
+    moments    = np.stack([sums(centered[:, i] * residual) for i in range(degree)], axis = 1)
+    coef       = np.linalg.solve(gram + alpha * np.eye(degree), moments[..., None])[..., 0]
+    intercepts = y_means - (means * coef).sum(axis = 1)
+
+    future   = lasts[:, None] + np.arange(1, days + 1)
+    forecast = intercepts[:, None] + (coef[:, None, :] * future[..., None].astype(float) ** np.arange(1, degree + 1)).sum(axis = 2)
+    output   = labels.repeat(days).to_frame(index = False)
+
+    output[x] = (origins[:, None] + future).ravel().astype('datetime64[D]')
+    output[y] = forecast.ravel()
+
+    return output
 
 def get_state_name(state_abbr):
     '''
@@ -0,0 +1,89 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Class:  ZipIndex
+
+This script maintains a compact, offline lookup table of geographically consistent city, state, and postal code triples.
+The table is built once, bundled as `Resources/zip_index.npz`, and loaded into memory as NumPy arrays.
+
+Layout:
+    states (U2):    The sorted two-letter state codes in the index
+    offsets (int):  Where each state's rows start in cities and zipcodes, with a trailing total
+    cities (U):     The major city for each row
+    zipcodes (U5):  The postal code for each row
+
+Considerations:
+    The index is built from uszipcode.SearchEngine.by_state, which is only needed when rebuilding it.
+    When that database isn't available, it can be rebuilt from any existing CSV that has city, state, and postal_code columns.
+    AK, HI, DC and PR are excluded to match the original CustomerInfo behavior.
+'''
+
+from .Utilities import *
+import numpy    as np
+import pandas   as pd
+
+class ZipIndex:
+    def __init__(self,
+                 filename        = save_path(True, 'Resources', 'zip_index.npz'),
+                 excluded_states = ('AK', 'HI', 'DC', 'PR')):
+        self.filename        = filename
+        self.excluded_states = excluded_states
+
+        index         = np.load(filename)
+        keep          = ~np.isin(index['states'], excluded_states)
+        counts        = np.diff(index['offsets'])
+        rows          = np.repeat(keep, counts)
+        self.states   = index['states'][keep]
+        self.counts   = counts[keep]
+        self.offsets  = np.concatenate([[0], np.cumsum(self.counts)])
+        self.cities   = index['cities'][rows]
+        self.zipcodes = index['zipcodes'][rows]
+
+    # Mutators
+    def set_city_state_zip(self, n, rng):
+        '''
+        Draw n (city, state, postal_code) arrays at once. A state is chosen uniformly, then a row is chosen uniformly within that state.
+        '''
+        state = rng.integers(0, len(self.states), n)
+        row   = self.offsets[state] + (rng.random(n) * self.counts[state]).astype(int)
+
+        return self.cities[row], self.states[state], self.zipcodes[row]
+
+    # Prescriptive Methods
+    @staticmethod
+    def save(filename, frame):
+        '''
+        Write a DataFrame of city, state, and postal_code rows to the compact .npz layout described above.
+        '''
+        frame   = frame.drop_duplicates().sort_values(['state', 'postal_code'])
+        states  = frame['state'].to_numpy().astype('U2')
+        offsets = np.searchsorted(states, np.unique(states))
+
+        np.savez_compressed(filename,
+                            states   = np.unique(states),
+                            offsets  = np.append(offsets, len(states)),
+                            cities   = frame['city'].to_numpy().astype(str),
+                            zipcodes = frame['postal_code'].to_numpy().astype('U5'))
+
+    @staticmethod
+    def build(filename = save_path(True, 'Resources', 'zip_index.npz'),
+              returns  = 5):
+        '''
+        Rebuild the index from the uszipcode database, keeping the first `returns` results per state as SearchEngine.by_state does by default.
+        '''
+        from uszipcode            import SearchEngine
+        from uszipcode.state_abbr import MAPPER_STATE_ABBR_SHORT_TO_LONG
+
+        search = SearchEngine()
+        rows   = [{'city'        : z.major_city,
+                   'state'       : z.state,
+                   'postal_code' : z.zipcode}
+                  for state in MAPPER_STATE_ABBR_SHORT_TO_LONG
+                  for z     in search.by_state(state, returns = returns)]
+
+        ZipIndex.save(filename, pd.DataFrame(rows))
+
+    @staticmethod
+    def build_from_csv(source,
+                       filename = save_path(True, 'Resources', 'zip_index.npz')):
+        ZipIndex.save(filename, pd.read_csv(source, usecols = ['city', 'state', 'postal_code'], dtype = str))
@@ -0,0 +1,92 @@
+'''
+Author: James Parkington
+Date:   2026-10-16
+Module: __main__
+
+This script regenerates any of the datasets from the command line, without a notebook. Run it from the Analysis directory,
+so the files land in `Data/` next to `jane.db`, exactly as the notebooks write them:
+
+    python -m Classes school_attendance --students 1000 --seed 7
+    python -m Classes students --students 1000 --seed 7
+    python -m Classes order_history --revenue 7000000 --aov 75 --seed 7 --workers 4
+    python -m Classes customer_info --revenue 7000000 --aov 75 --seed 7 --fmt parquet
+    python -m Classes order_history --seed 7 --stream 1000000 --pipelined
+
+Considerations:
+    students and customer_info rebuild the SchoolAttendance or OrderHistory they depend on from the same arguments, so passing
+    the seed used for that dataset reproduces the ids (and, for customer_info, the spend weights) that were saved with it.
+    --stream writes in chunks of the given size through the class's stream(), which always writes CSV. Adding --pipelined writes the
+    CSV and SQLite table in their own threads while the next chunks are generated.
+    Only the generator modules are imported, so no plotting or notebook dependencies are loaded.
+'''
+
+from datetime import date
+import argparse
+import time
+
+def get_parser():
+    parser   = argparse.ArgumentParser(prog = 'python -m Classes', description = 'Regenerate a dataset as a file in Data/ and a table in jane.db.')
+    datasets = parser.add_subparsers(dest = 'dataset', required = True)
+
+    for name in ['school_attendance', 'students']:
+        dataset = datasets.add_parser(name)
+        dataset.add_argument('--start',    type = date.fromisoformat, default = date(2023, 1, 1))
+        dataset.add_argument('--end',      type = date.fromisoformat, default = date(2023, 1, 31))
+        dataset.add_argument('--students', type = int,                default = 1000)
+
+    for name in ['order_history', 'customer_info']:
+        dataset = datasets.add_parser(name)
+        dataset.add_argument('--revenue', type = int,                default = 7000000)
+        dataset.add_argument('--aov',     type = int,                default = 75)
+        dataset.add_argument('--start',   type = date.fromisoformat, default = date(2022, 1, 1))
+        dataset.add_argument('--end',     type = date.fromisoformat, default = date(2022, 12, 31))
+
+    for dataset in datasets.choices.values():
+        dataset.add_argument('--seed',      type = int)
+        dataset.add_argument('--fmt',       choices = ['csv', 'parquet', 'feather'], default = 'csv')
+        dataset.add_argument('--workers',   type = int, help = 'Generate in seeded shards across this many processes (not used by students)')
+        dataset.add_argument('--stream',    type = int, metavar = 'CHUNK_SIZE', help = 'Write the dataset in chunks of this many rows')
+        dataset.add_argument('--pipelined', action = 'store_true', help = 'With --stream, write the CSV and SQLite table in their own threads')
+
+    return parser
+
+
+def get_generator(args):
+    '''
+    Build the generator for args.dataset, along with the keyword arguments its __call__ accepts.
+    '''
+    if args.dataset in ('school_attendance', 'students'):
+        from .SchoolAttendance import SchoolAttendance
+
+        attendance = SchoolAttendance(args.start, args.end, args.students, seed = args.seed)
+        if args.dataset == 'school_attendance':
+            return attendance, {'workers': args.workers, 'fmt': args.fmt}
+
+        from .Students import Students
+        return Students(attendance, seed = args.seed), {'fmt': args.fmt}
+
+    from .OrderHistory import OrderHistory
+
+    order_history = OrderHistory(args.revenue, args.aov, args.start, args.end, seed = args.seed)
+    if args.dataset == 'order_history':
+        return order_history, {'workers': args.workers, 'fmt': args.fmt}
+
+    from .CustomerInfo import CustomerInfo
+    return CustomerInfo(order_history, seed = args.seed), {'workers': args.workers, 'fmt': args.fmt}
+
+
+def main(argv = None):
+    args                 = get_parser().parse_args(argv)
+    start                = time.perf_counter()
+    generator, arguments = get_generator(args)
+
+    if args.stream:
+        rows = generator.stream(args.stream, pipelined = args.pipelined)
+    else:
+        rows = len(generator(**arguments))
+
+    print(f'{generator.sql_table}: {rows:,} rows in {time.perf_counter() - start:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
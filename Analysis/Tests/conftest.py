@@ -0,0 +1,8 @@
+'''
+Makes `Classes` importable from the tests, the same way the notebooks import it from the Analysis directory.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
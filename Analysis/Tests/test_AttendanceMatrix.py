@@ -0,0 +1,22 @@
+from Classes.AttendanceMatrix import AttendanceMatrix
+import numpy  as np
+import pytest
+
+def get_matrix():
+    dates      = np.arange('2023-01-02', '2023-01-12', dtype = 'datetime64[D]')
+    attendance = np.array([[1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+                           [1, 0, 1, 0, 1, 0, 1, 0, 1, 0],
+                           [0, 0, 0, 0, 0, 0, 0, 0, 0, 1]], dtype = 'uint8')
+
+    return AttendanceMatrix(np.packbits(attendance, axis = 1), dates, np.array([1000001, 1000005, 1000009]))
+
+def test_get_rows_accepts_a_scalar_student_id():
+    matrix = get_matrix()
+
+    assert matrix.get_rows(1000005).tolist() == [1]
+    assert matrix.get_daily_rates(1000005).tolist() == [1, 0, 1, 0, 1, 0, 1, 0, 1, 0]
+
+@pytest.mark.parametrize('student_id', [1000000, 1000003, 1000010])
+def test_get_rows_raises_for_unknown_student_ids(student_id):
+    with pytest.raises(KeyError):
+        get_matrix().get_rows([1000001, student_id])
@@ -0,0 +1,27 @@
+from datetime              import date
+from Classes.OrderHistory import OrderHistory
+import numpy  as np
+
+def get_orders_per_customer(order_history):
+    '''
+    Return the number of customers with each order count, across the customer_ids of the generated orders.
+    '''
+    _, counts = np.unique(order_history.generate_columns()['customer_id'], return_counts = True)
+    return dict(zip(*np.unique(counts, return_counts = True)))
+
+def test_segment_order_counts_hold_above_four_orders_per_customer():
+    order_history = OrderHistory(7500000, 75, date(2022, 1, 1), date(2022, 12, 31), seed = 7, segments = ((0.5, 8), (0.5, 2)))
+
+    assert get_orders_per_customer(order_history) == {2: 10000, 8: 10000}
+    assert len(order_history.get_customer_ids()) == 20000
+
+def test_every_customer_id_has_an_order_with_zipf_segments():
+    shares, orders = np.array(OrderHistory.get_zipf_segments(1.5)).T
+    order_history  = OrderHistory(7500000, 75, date(2022, 1, 1), date(2022, 12, 31), seed = 7, segments = OrderHistory.get_zipf_segments(1.5))
+    customer_ids   = order_history.generate_columns()['customer_id']
+    expected       = np.round(shares * order_history.num_orders / (shares @ orders))
+    observed       = get_orders_per_customer(order_history)
+
+    assert shares @ orders > 4
+    assert np.array_equal(order_history.get_customer_ids(), np.unique(customer_ids))
+    assert sum(abs(observed.get(k, 0) - customers) for k, customers in zip(orders.astype(int), expected)) <= 0.02 * expected.sum()
@@ -0,0 +1,18 @@
+from Classes.Utilities import external_sort
+import numpy  as np
+import pandas as pd
+import pytest
+
+@pytest.mark.parametrize('ascending', [True, False])
+def test_external_sort_matches_a_full_sort(ascending):
+    rng    = np.random.default_rng(0)
+    chunks = [pd.DataFrame({'store_id' : rng.integers(0, 20, size),
+                            'order_id' : np.char.add('O', rng.integers(1000000, 1000500, size).astype(str)),
+                            'amount'   : rng.random(size)}) for size in [700, 0, 1300, 450]]
+
+    merged   = pd.concat(external_sort(iter(chunks), ['store_id', 'order_id'], ascending, chunk_size = 256), ignore_index = True)
+    expected = pd.concat(chunks, ignore_index = True).sort_values(['store_id', 'order_id'], ascending = ascending, ignore_index = True)
+
+    assert len(merged) == len(expected)
+    pd.testing.assert_frame_equal(merged[['store_id', 'order_id']], expected[['store_id', 'order_id']])
+    assert np.isclose(merged['amount'].sum(), expected['amount'].sum())